@@ -100,7 +100,7 @@ if [ "$SKIP_ENV" = true ]; then
     info "Skipping dependency installation (--skip-env)"
 else
     info "Installing utility packages..."
-    "${ENV_DIR}/bin/pip" install loguru click pandas numpy tqdm
+    "${ENV_DIR}/bin/pip" install loguru click pandas numpy tqdm orjson
 
     info "Installing MCP dependencies..."
     "${ENV_DIR}/bin/pip" install "mcp>=1.1.0" "pydantic>=2.0.0" "pydantic-settings>=2.0.0" "httpx>=0.24.0"
@@ -111,6 +111,14 @@ else
     info "Installing fastmcp..."
     "${ENV_DIR}/bin/pip" install --ignore-installed fastmcp loguru --force-reinstall --no-cache-dir
     success "Dependencies installed"
+
+    info "Building optional compiled TSV parser..."
+    "${ENV_DIR}/bin/pip" install cython setuptools
+    if (cd "${SCRIPT_DIR}" && "${ENV_DIR}/bin/cythonize" -i -3 scripts/lib/_parsers.pyx); then
+        success "Compiled TSV parser built"
+    else
+        warn "Compiled TSV parser not built (needs a C compiler); the pure-Python parser will be used"
+    fi
 fi
 
 # Step 3: Verify installation
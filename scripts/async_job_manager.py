@@ -22,13 +22,44 @@ Example:
 # ==============================================================================
 import argparse
 import asyncio
+import atexit
 import json
+import os
+import sys
 import time
-import uuid
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Union, Optional, Dict, Any, Iterator, List, Mapping, Set, Tuple
 from datetime import datetime, timedelta
 
+# fcntl (POSIX only) serializes journal writers across processes
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# numpy is optional; it vectorizes random dataset generation when present
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is an optional speedup; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 # ==============================================================================
 # Configuration (extracted from use case)
 # ==============================================================================
@@ -42,87 +73,407 @@ DEFAULT_CONFIG = {
     "timeout": 1800
 }
 
+# Read-only view shared by every call that passes no overrides
+_DEFAULT_CONFIG_VIEW = MappingProxyType(DEFAULT_CONFIG)
+
+# Real seconds per simulated second of the mock queue; below 1.0 jobs move faster
+SIMULATED_TIME_SCALE = 1.0
+
 # ==============================================================================
 # Inlined Utility Functions (simplified from repo)
 # ==============================================================================
-def load_job_state(state_file: Path) -> Dict[str, Any]:
-    """Load persistent job state from JSON file."""
-    if not state_file.exists():
-        return {"jobs": {}, "history": []}
+STATE_SNAPSHOT_NAME = "state.snapshot.json"
+STATE_JOURNAL_NAME = "state.journal.jsonl"
+STATE_LOCK_NAME = "state.lock"
+JOURNAL_COMPACT_BYTES = 1024 * 1024  # Fold the journal into the snapshot past 1 MB
+FLUSH_INTERVAL_SECONDS = 0.05  # Debounce window for coalescing journal writes
+FLUSH_MAX_PENDING_EVENTS = 256  # Flush without waiting once this many events queue up
+
+def _empty_job_state() -> Dict[str, Any]:
+    """Return a fresh, empty job state."""
+    return {"jobs": {}, "history": []}
+
+def _apply_job_event(state: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Replay a single journal event onto an in-memory job state."""
+    if event.get("op") != "upsert":
+        return
+
+    job_id = event["job_id"]
+    fields = event.get("fields", {})
+    job_info = state["jobs"].get(job_id)
+    if job_info is None:
+        job_info = state["jobs"][job_id] = {}
+        state["history"].append(job_id)
+    elif job_info.get("status") in TERMINAL_JOB_STATES:
+        # A stale writer's refresh landing after another process's cancel must not revive the job
+        fields = {k: v for k, v in fields.items() if k not in ("status", "progress")}
+    job_info.update(fields)
+
+def load_job_state(state_dir: Path) -> Dict[str, Any]:
+    """Load persistent job state from the snapshot and replay the journal on top."""
+    snapshot_file = state_dir / STATE_SNAPSHOT_NAME
+    journal_file = state_dir / STATE_JOURNAL_NAME
+
+    # Pre-journal installs kept everything in a single results/job_state.json
+    if not snapshot_file.exists():
+        snapshot_file = state_dir.with_suffix(".json")
+
+    state = _empty_job_state()
+    if snapshot_file.exists():
+        try:
+            state = _json_loads(snapshot_file.read_bytes())
+        except (ValueError, IOError):
+            state = _empty_job_state()
+
+    if journal_file.exists():
+        try:
+            with open(journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        event = _json_loads(line)
+                    except ValueError:
+                        continue  # Torn trailing write from an interrupted append
+                    _apply_job_event(state, event)
+        except IOError:
+            pass
+
+    return state
+
+def _stamp(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identify a version of a file by inode, size and modification time."""
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _journal_stamp(state_dir: Path) -> Optional[Tuple[int, int, int]]:
+    """Stamp of the journal in state_dir, or None if there is no journal yet."""
+    try:
+        return _stamp(os.stat(state_dir / STATE_JOURNAL_NAME))
+    except FileNotFoundError:
+        return None
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write the whole buffer to fd, resuming after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _atomic_write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write a pre-serialized buffer to a temp file, then rename it over path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, data)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+@contextmanager
+def _locked_state_dir(state_dir: Path) -> Iterator[None]:
+    """
+    Hold the state directory's writer lock.
 
+    Every journal append and every compaction runs under this lock, so no
+    process can append between a compaction's load and its truncate.
+    """
+    fd = os.open(state_dir / STATE_LOCK_NAME, os.O_WRONLY | os.O_CREAT, 0o644)
     try:
-        with open(state_file) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {"jobs": {}, "history": []}
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # Closing the descriptor releases the lock
+
+def _compact_locked(state_dir: Path) -> None:
+    """Fold the journal into a fresh snapshot; the caller holds the writer lock."""
+    state = load_job_state(state_dir)
+    _atomic_write_bytes(
+        state_dir / STATE_SNAPSHOT_NAME,
+        _json_dumps(state),
+        fsync=True
+    )
 
-def save_job_state(state: Dict[str, Any], state_file: Path) -> None:
-    """Save persistent job state to JSON file."""
-    state_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    # Truncate only after the snapshot is in place so a crash never loses events
+    os.truncate(state_dir / STATE_JOURNAL_NAME, 0)
+
+def compact_state(state_dir: Path) -> None:
+    """Fold the journal into a fresh snapshot and truncate the journal."""
+    state_dir.mkdir(parents=True, exist_ok=True)
+    with _locked_state_dir(state_dir):
+        _compact_locked(state_dir)
+
+def append_job_events(events: List[Dict[str, Any]], state_dir: Path) -> None:
+    """Append job state deltas to the journal, compacting when it grows too large."""
+    if not events:
+        return
+
+    state_dir.mkdir(parents=True, exist_ok=True)
+    data = b"".join(_json_dumps(event) + b"\n" for event in events)
+
+    with _locked_state_dir(state_dir):
+        fd = os.open(state_dir / STATE_JOURNAL_NAME, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            before = _stamp(os.fstat(fd))
+            _write_all(fd, data)
+            journal_size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+        if journal_size > JOURNAL_COMPACT_BYTES:
+            _compact_locked(state_dir)
+
+        # The cache already holds these events; only another writer's changes force a reload
+        if _journal_stamps.get(state_dir) == before:
+            _journal_stamps[state_dir] = _journal_stamp(state_dir)
+
+def append_job_event(event: Dict[str, Any], state_dir: Path) -> None:
+    """Append a single job state delta to the journal."""
+    append_job_events([event], state_dir)
+
+# In-memory write-behind state shared by every operation in this process
+_state_cache: Dict[Path, Dict[str, Any]] = {}
+_journal_stamps: Dict[Path, Optional[Tuple[int, int, int]]] = {}  # Journal as of the cached state
+_pending_events: Dict[Path, List[Dict[str, Any]]] = {}
+_flusher: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event, asyncio.Lock, asyncio.Task]] = None
+
+# A single writer thread appends batches in the order they were taken, so a
+# flush started during shutdown can never overtake one that is still in flight
+_journal_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-journal")
+
+def get_cached_job_state(state_dir: Path) -> Dict[str, Any]:
+    """
+    Return the in-memory job state, reloading it whenever the journal changed.
+
+    Another process (e.g. a CLI --cancel) may have appended to or compacted the
+    journal since the last load; a stat per call is enough to notice.
+    """
+    stamp = _journal_stamp(state_dir)
+    state = _state_cache.get(state_dir)
+    if state is None or stamp != _journal_stamps.get(state_dir):
+        state = load_job_state(state_dir)
+        # Queued events, including any append still in flight, may not be on disk yet
+        for event in _pending_events.get(state_dir, []):
+            _apply_job_event(state, event)
+        _state_cache[state_dir] = state
+        _journal_stamps[state_dir] = stamp
+    return state
+
+def _has_pending_events() -> bool:
+    """Whether any journal events are waiting to be written."""
+    return any(_pending_events.values())
+
+def _write_pending_events() -> None:
+    """
+    Append every queued event to its journal.
+
+    Events leave the queue only once their append is done, so a reload of the
+    cached state meanwhile still replays them. Only the journal writer thread
+    (or the exit hook, after it has stopped) calls this, so no two flushes ever
+    write the same events.
+    """
+    for state_dir, queued in list(_pending_events.items()):
+        events = queued[:]
+        if events:
+            append_job_events(events, state_dir)
+            del queued[:len(events)]
+
+async def _flush_pending_events(lock: asyncio.Lock) -> None:
+    """Write every queued event off the event loop, one flush at a time."""
+    async with lock:
+        if _has_pending_events():
+            await asyncio.get_running_loop().run_in_executor(_journal_writer, _write_pending_events)
+
+async def _run_flusher(dirty: asyncio.Event, lock: asyncio.Lock) -> None:
+    """Coalesce queued events into one journal write per burst."""
+    while True:
+        await dirty.wait()
+        queued = sum(len(events) for events in _pending_events.values())
+        if queued < FLUSH_MAX_PENDING_EVENTS:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        dirty.clear()
+        await _flush_pending_events(lock)
+
+def _flush_after_flusher_exit(task: asyncio.Task) -> None:
+    """
+    Write the events still queued when the flusher stops.
+
+    asyncio.run cancels the flusher as soon as the main coroutine returns, often
+    before the debounce window ends; a done callback runs even if the task is
+    cancelled before its first step, which a finally block inside it would not.
+    """
+    if _has_pending_events():
+        _journal_writer.submit(_write_pending_events).result()
+
+def _ensure_flusher(loop: asyncio.AbstractEventLoop) -> asyncio.Event:
+    """Start the background flusher for this event loop if it is not running yet."""
+    global _flusher
+    if _flusher is None or _flusher[0] is not loop or _flusher[3].done():
+        dirty = asyncio.Event()
+        lock = asyncio.Lock()
+        task = loop.create_task(_run_flusher(dirty, lock))
+        task.add_done_callback(_flush_after_flusher_exit)
+        _flusher = (loop, dirty, lock, task)
+    return _flusher[1]
+
+def record_job_events(events: List[Dict[str, Any]], state_dir: Path) -> None:
+    """
+    Apply job state deltas to the cached state and queue them for the journal.
+
+    Inside an event loop the write is left to the debounced flusher, which also
+    writes whatever is queued when the loop shuts down; without a loop the
+    events are appended immediately.
+    """
+    if not events:
+        return
+
+    state = _state_cache.get(state_dir)
+    if state is not None:
+        for event in events:
+            _apply_job_event(state, event)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        append_job_events(events, state_dir)
+        return
+
+    _pending_events.setdefault(state_dir, []).extend(events)
+    _ensure_flusher(loop).set()
+
+async def flush_job_state() -> None:
+    """Write any queued job state events now, without waiting for the debounce window."""
+    loop = asyncio.get_running_loop()
+    if _flusher is not None and _flusher[0] is loop:
+        await _flush_pending_events(_flusher[2])
+    else:
+        await loop.run_in_executor(_journal_writer, _write_pending_events)
+
+@atexit.register
+def _flush_job_state_at_exit() -> None:
+    """Last-chance flush for events queued when the loop went away unflushed."""
+    _write_pending_events()
+
+def job_upsert_event(job_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a journal event that creates or updates fields of a job record."""
+    return {"op": "upsert", "job_id": job_id, "fields": fields}
+
+AMINO_ACIDS = b'ACDEFGHIKLMNPQRSTVWY'
+
+def _random_residues(num_sequences: int) -> Tuple[List[int], bytes]:
+    """Draw per-sequence lengths (100-500 aa) and all residues in one batch."""
+    if np is not None:
+        rng = np.random.default_rng()
+        alphabet = np.frombuffer(AMINO_ACIDS, dtype=np.uint8)
+        lengths = rng.integers(100, 501, size=num_sequences)
+        idx = rng.integers(0, len(AMINO_ACIDS), size=int(lengths.sum()), dtype=np.uint8)
+        return lengths.tolist(), alphabet[idx].tobytes()
 
-def generate_large_protein_dataset(output_path: Path, num_sequences: int = 20) -> None:
-    """Generate a large protein dataset for testing async jobs."""
     import random
 
-    amino_acids = 'ACDEFGHIKLMNPQRSTVWY'
-    sequences = []
+    lengths = [random.randint(100, 500) for _ in range(num_sequences)]
+    return lengths, bytes(random.choices(AMINO_ACIDS, k=sum(lengths)))
 
-    for i in range(num_sequences):
-        # Generate random protein sequence (100-500 amino acids)
-        length = random.randint(100, 500)
-        sequence = ''.join(random.choice(amino_acids) for _ in range(length))
+def generate_large_protein_dataset(output_path: Path, num_sequences: int = 20) -> None:
+    """Generate a large protein dataset for testing async jobs."""
+    lengths, residues = _random_residues(num_sequences)
 
-        header = f">PROTEIN_{i+1:03d}|Generated protein {i+1}|Test organism"
-        sequences.append((header, sequence))
+    chunks: List[bytes] = []
+    offset = 0
+    for i, length in enumerate(lengths):
+        chunks.append(f">PROTEIN_{i+1:03d}|Generated protein {i+1}|Test organism\n".encode())
+        chunks.append(residues[offset:offset + length])
+        chunks.append(b"\n")
+        offset += length
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        for header, sequence in sequences:
-            f.write(f"{header}\n{sequence}\n")
+    output_path.write_bytes(b"".join(chunks))
 
 def estimate_processing_time(input_file: Path) -> int:
     """Estimate processing time in minutes based on file size."""
     try:
-        file_size_kb = input_file.stat().st_size // 1024
+        file_size_kb = os.stat(os.fspath(input_file)).st_size >> 10
         # Simple estimation: 1 minute per KB for demo purposes
         return max(1, min(60, file_size_kb))  # Cap between 1-60 minutes
-    except:
+    except OSError:
         return 5  # Default 5 minutes
 
 # ==============================================================================
 # Job Management Functions (inlined from patched use case)
 # ==============================================================================
+def merge_config(config: Optional[Dict[str, Any]], overrides: Dict[str, Any]) -> Mapping[str, Any]:
+    """Merge config overrides onto DEFAULT_CONFIG, skipping the copy when there are none."""
+    if not config and not overrides:
+        return _DEFAULT_CONFIG_VIEW
+    return {**DEFAULT_CONFIG, **(config or {}), **overrides}
+
 def generate_job_id() -> str:
     """Generate unique job identifier."""
-    return f"job_{uuid.uuid4().hex[:8]}"
+    return f"job_{os.urandom(4).hex()}"
 
 def get_job_state_file() -> Path:
-    """Get path to persistent job state file."""
-    return Path("results/job_state.json")
+    """Get path to the persistent job state directory (snapshot + journal)."""
+    return Path("results/job_state")
+
+_MOCK_RESULTS_TEMPLATE = "\n".join([
+    "# InterProScan version 5.59-91.0 - Async Results",
+    "# Analysis completed via background queue",
+    "# Job ID: {job_id}",
+    "# Input: {input_file}",
+    "# Completion time: {timestamp}",
+    "#",
+    "# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways",
+    "PROTEIN_001\thash1abc123\t256\tPfam\tPF00001\tTest_Domain_1\t15\t245\t1.2E-15\tT\t{date}\tIPR001001\tTest domain 1\tGO:0003677|DNA binding\tREACTOME:R-HSA-12345",
+    "PROTEIN_001\thash1abc123\t256\tPRINTS\tPR00001\tTest_Family_1\t50\t200\t-\tT\t{date}\tIPR002001\tTest family 1\tGO:0005515|protein binding\t-",
+    "PROTEIN_002\thash2def456\t189\tPfam\tPF00002\tTest_Domain_2\t20\t180\t3.4E-12\tT\t{date}\tIPR001002\tTest domain 2\tGO:0016740|transferase activity\tKEGG:map00010",
+    "PROTEIN_003\thash3ghi789\t342\tSUPERFAMILY\tSSF50001\tTest_Superfamily\t10\t320\t2.1E-18\tT\t{date}\tIPR003001\tTest superfamily\tGO:0003824|catalytic activity\t-",
+    ""
+])
 
 def generate_mock_results(input_file: str, job_id: str) -> str:
     """Generate realistic mock TSV results for completed job."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    return f"""# InterProScan version 5.59-91.0 - Async Results
-# Analysis completed via background queue
-# Job ID: {job_id}
-# Input: {input_file}
-# Completion time: {timestamp}
-#
-# Sequence	MD5 checksum	Sequence length	Analysis	Signature accession	Signature description	Start location	Stop location	Score	Status	Date	InterPro accession	InterPro description	GO annotations	Pathways
-PROTEIN_001	hash1abc123	256	Pfam	PF00001	Test_Domain_1	15	245	1.2E-15	T	{timestamp[:10]}	IPR001001	Test domain 1	GO:0003677|DNA binding	REACTOME:R-HSA-12345
-PROTEIN_001	hash1abc123	256	PRINTS	PR00001	Test_Family_1	50	200	-	T	{timestamp[:10]}	IPR002001	Test family 1	GO:0005515|protein binding	-
-PROTEIN_002	hash2def456	189	Pfam	PF00002	Test_Domain_2	20	180	3.4E-12	T	{timestamp[:10]}	IPR001002	Test domain 2	GO:0016740|transferase activity	KEGG:map00010
-PROTEIN_003	hash3ghi789	342	SUPERFAMILY	SSF50001	Test_Superfamily	10	320	2.1E-18	T	{timestamp[:10]}	IPR003001	Test superfamily	GO:0003824|catalytic activity	-
-"""
+    return _MOCK_RESULTS_TEMPLATE.format(
+        job_id=job_id,
+        input_file=input_file,
+        timestamp=timestamp,
+        date=timestamp[:10]
+    )
 
-async def simulate_job_progression(job_info: Dict[str, Any]) -> str:
+def _elapsed_minutes(job_info: Dict[str, Any]) -> float:
+    """Simulated minutes since submission, from the cached epoch timestamp."""
+    submitted_ts = job_info.get("submitted_ts")
+    if submitted_ts is None:
+        # Backfill records written before submitted_ts existed
+        submitted_ts = datetime.fromisoformat(job_info["submitted_at"]).timestamp()
+        job_info["submitted_ts"] = submitted_ts
+    return (time.time() - submitted_ts) / SIMULATED_TIME_SCALE / 60
+
+# Simulated seconds after submission at which simulate_job_progression enters each status
+_SIMULATED_STATUS_STARTS = (("queued", 0.0), ("running", 60.0), ("completed", 180.0))
+
+# Statuses a job never leaves, so wait_for_state stops at them
+TERMINAL_JOB_STATES = frozenset({"completed", "cancelled", "failed"})
+
+# job_id -> one Event per wait_for_state caller, set whenever the job's status changes
+_state_waiters: Dict[str, Set[asyncio.Event]] = {}
+
+def _notify_state_change(job_id: str) -> None:
+    """Wake every wait_for_state caller watching job_id."""
+    for event in _state_waiters.get(job_id, ()):
+        event.set()
+
+def _next_transition_delay(job_info: Dict[str, Any]) -> Optional[float]:
+    """Real seconds until the simulated schedule next changes this job's status, or None."""
+    elapsed_seconds = _elapsed_minutes(job_info) * 60
+    for _, starts_at in _SIMULATED_STATUS_STARTS:
+        if starts_at > elapsed_seconds:
+            return (starts_at - elapsed_seconds) * SIMULATED_TIME_SCALE
+    return None
+
+def simulate_job_progression(job_info: Dict[str, Any]) -> str:
     """Simulate realistic job status progression over time."""
-    submitted_time = datetime.fromisoformat(job_info["submitted_at"])
-    elapsed_minutes = (datetime.now() - submitted_time).total_seconds() / 60
+    elapsed_minutes = _elapsed_minutes(job_info)
 
     # Status progression based on elapsed time
     if elapsed_minutes < 1:
@@ -134,23 +485,52 @@ async def simulate_job_progression(job_info: Dict[str, Any]) -> str:
 
 def calculate_progress(job_info: Dict[str, Any]) -> int:
     """Calculate job progress percentage."""
-    submitted_time = datetime.fromisoformat(job_info["submitted_at"])
-    elapsed_minutes = (datetime.now() - submitted_time).total_seconds() / 60
-
     if job_info["status"] == "queued":
         return 0
     elif job_info["status"] == "running":
         # Progress linearly from 5% to 95% during running phase
-        return min(95, max(5, int(elapsed_minutes * 30)))
+        return min(95, max(5, int(_elapsed_minutes(job_info) * 30)))
     elif job_info["status"] == "completed":
         return 100
     else:
         return 0
 
+def _refresh_job(job_id: str, job_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Advance a job's simulated status in place and return journal events for any change."""
+    # Cancelled (or otherwise finished) jobs keep their status instead of resuming the schedule
+    if job_info["status"] in TERMINAL_JOB_STATES:
+        return []
+
+    previous = (job_info["status"], job_info["progress"])
+    job_info["status"] = simulate_job_progression(job_info)
+    job_info["progress"] = calculate_progress(job_info)
+
+    if (job_info["status"], job_info["progress"]) == previous:
+        return []
+    if job_info["status"] != previous[0]:
+        _notify_state_change(job_id)
+    return [job_upsert_event(job_id, {
+        "status": job_info["status"],
+        "progress": job_info["progress"]
+    })]
+
+def _get_or_refresh_job(
+    state: Dict[str, Any],
+    job_id: str,
+    events: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Look up and refresh a job on an already-loaded state, collecting journal events."""
+    job_info = state["jobs"].get(job_id)
+    if job_info is None:
+        raise ValueError(f"Job {job_id} not found")
+
+    events.extend(_refresh_job(job_id, job_info))
+    return job_info
+
 # ==============================================================================
 # Core Functions (main logic extracted from use case)
 # ==============================================================================
-async def submit_job(
+def _impl_submit_job(
     input_file: Union[str, Path],
     priority: int = 5,
     output_format: str = "tsv",
@@ -160,32 +540,10 @@ async def submit_job(
     config: Optional[Dict[str, Any]] = None,
     **kwargs
 ) -> Dict[str, Any]:
-    """
-    Submit an InterProScan job to the background queue.
-
-    Args:
-        input_file: Path to protein FASTA file
-        priority: Job priority (1-10, higher is more important)
-        output_format: Output format (tsv, xml, json, gff3)
-        databases: Comma-separated list of databases to search
-        notification_email: Email for completion notification
-        tags: List of tags for job organization
-        config: Configuration dict (uses DEFAULT_CONFIG if not provided)
-        **kwargs: Override specific config parameters
-
-    Returns:
-        Dict containing:
-            - job_id: Unique job identifier
-            - estimated_completion: Estimated completion time
-            - status: Submission status
-
-    Example:
-        >>> result = await submit_job("input.fasta", priority=8)
-        >>> print(result['job_id'])
-    """
+    """Synchronous core of submit_job."""
     # Setup
     input_file = Path(input_file)
-    config = {**DEFAULT_CONFIG, **(config or {}), **kwargs}
+    config = merge_config(config, kwargs)
 
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
@@ -196,7 +554,9 @@ async def submit_job(
     # Generate job ID and timing
     job_id = generate_job_id()
     estimated_minutes = estimate_processing_time(input_file)
-    estimated_completion = datetime.now() + timedelta(minutes=estimated_minutes)
+    submitted_ts = time.time()
+    submitted_at = datetime.fromtimestamp(submitted_ts)
+    estimated_completion = submitted_at + timedelta(minutes=estimated_minutes)
 
     # Create job record
     job_info = {
@@ -208,26 +568,25 @@ async def submit_job(
         "priority": priority,
         "tags": tags or [],
         "notification_email": notification_email,
-        "submitted_at": datetime.now().isoformat(),
+        "submitted_at": submitted_at.isoformat(),
+        "submitted_ts": submitted_ts,
         "estimated_completion": estimated_completion.isoformat(),
         "progress": 0
     }
 
-    # Load and update job state
-    state_file = get_job_state_file()
-    state = load_job_state(state_file)
-    state["jobs"][job_id] = job_info
-    state["history"].append(job_id)
-    save_job_state(state, state_file)
-
-    print(f"🚀 Job submitted successfully!")
-    print(f"📋 Job configuration:")
-    print(f"  • Job ID: {job_id}")
-    print(f"  • Priority: {priority}/10")
-    print(f"  • Output format: {output_format}")
-    print(f"  • Databases: {databases or 'all'}")
-    print(f"  • Estimated time: {estimated_minutes} minutes")
-    print(f"  • Estimated completion: {estimated_completion.strftime('%Y-%m-%d %H:%M:%S')}")
+    # Record the new job in the state journal
+    record_job_events([job_upsert_event(job_id, job_info)], get_job_state_file())
+
+    sys.stdout.write("\n".join([
+        "🚀 Job submitted successfully!",
+        "📋 Job configuration:",
+        f"  • Job ID: {job_id}",
+        f"  • Priority: {priority}/10",
+        f"  • Output format: {output_format}",
+        f"  • Databases: {databases or 'all'}",
+        f"  • Estimated time: {estimated_minutes} minutes",
+        f"  • Estimated completion: {estimated_completion.strftime('%Y-%m-%d %H:%M:%S')}"
+    ]) + "\n")
 
     return {
         "job_id": job_id,
@@ -236,41 +595,20 @@ async def submit_job(
         "message": "Job submitted successfully to queue"
     }
 
-async def get_job_status(job_id: str) -> Dict[str, Any]:
-    """
-    Get status of a submitted job.
-
-    Args:
-        job_id: Job identifier
-
-    Returns:
-        Dict containing job status information
-
-    Example:
-        >>> status = await get_job_status("job_abc12345")
-        >>> print(status['job_status'])
-    """
+def _impl_get_job_status(job_id: str) -> Dict[str, Any]:
+    """Synchronous core of get_job_status."""
     state_file = get_job_state_file()
-    state = load_job_state(state_file)
-
-    if job_id not in state["jobs"]:
-        raise ValueError(f"Job {job_id} not found")
-
-    job_info = state["jobs"][job_id]
-
-    # Update job status based on time progression
-    current_status = await simulate_job_progression(job_info)
-    job_info["status"] = current_status
-    job_info["progress"] = calculate_progress(job_info)
+    state = get_cached_job_state(state_file)
 
-    # Save updated state
-    save_job_state(state, state_file)
+    events = []
+    job_info = _get_or_refresh_job(state, job_id, events)
+    record_job_events(events, state_file)
 
-    print(f"📊 Job {job_id} status: {current_status} ({job_info['progress']}%)")
+    print(f"📊 Job {job_id} status: {job_info['status']} ({job_info['progress']}%)")
 
     return {
         "job_id": job_id,
-        "job_status": current_status,
+        "job_status": job_info["status"],
         "progress": job_info["progress"],
         "submitted_at": job_info["submitted_at"],
         "input_file": job_info["input_file"],
@@ -278,30 +616,18 @@ async def get_job_status(job_id: str) -> Dict[str, Any]:
         "estimated_completion": job_info.get("estimated_completion")
     }
 
-async def get_job_result(job_id: str, output_file: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
-    """
-    Get results from a completed job.
-
-    Args:
-        job_id: Job identifier
-        output_file: Optional path to save results
-
-    Returns:
-        Dict containing job results
-
-    Example:
-        >>> result = await get_job_result("job_abc12345", "results.tsv")
-        >>> print(result['output_file'])
-    """
-    # Check job status first
-    status_info = await get_job_status(job_id)
+def _impl_get_job_result(job_id: str, output_file: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """Synchronous core of get_job_result."""
+    # Check job status first, on the same state used to build the results
+    state_file = get_job_state_file()
+    state = get_cached_job_state(state_file)
 
-    if status_info["job_status"] != "completed":
-        raise ValueError(f"Job {job_id} is not completed yet (status: {status_info['job_status']})")
+    events = []
+    job_info = _get_or_refresh_job(state, job_id, events)
 
-    state_file = get_job_state_file()
-    state = load_job_state(state_file)
-    job_info = state["jobs"][job_id]
+    if job_info["status"] != "completed":
+        record_job_events(events, state_file)
+        raise ValueError(f"Job {job_id} is not completed yet (status: {job_info['status']})")
 
     # Generate results
     results = generate_mock_results(job_info["input_file"], job_id)
@@ -312,11 +638,12 @@ async def get_job_result(job_id: str, output_file: Optional[Union[str, Path]] =
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            f.write(results)
+        output_path.write_bytes(results.encode())
 
         print(f"💾 Results saved to: {output_path}")
 
+    record_job_events(events, state_file)
+
     print(f"📁 Job {job_id} results ready")
 
     return {
@@ -331,18 +658,10 @@ async def get_job_result(job_id: str, output_file: Optional[Union[str, Path]] =
         }
     }
 
-async def cancel_job(job_id: str) -> Dict[str, Any]:
-    """
-    Cancel a submitted job.
-
-    Args:
-        job_id: Job identifier
-
-    Returns:
-        Dict containing cancellation status
-    """
+def _impl_cancel_job(job_id: str) -> Dict[str, Any]:
+    """Synchronous core of cancel_job."""
     state_file = get_job_state_file()
-    state = load_job_state(state_file)
+    state = get_cached_job_state(state_file)
 
     if job_id not in state["jobs"]:
         raise ValueError(f"Job {job_id} not found")
@@ -352,10 +671,12 @@ async def cancel_job(job_id: str) -> Dict[str, Any]:
     if job_info["status"] == "completed":
         raise ValueError(f"Cannot cancel completed job {job_id}")
 
-    job_info["status"] = "cancelled"
-    job_info["cancelled_at"] = datetime.now().isoformat()
+    record_job_events([job_upsert_event(job_id, {
+        "status": "cancelled",
+        "cancelled_at": datetime.now().isoformat()
+    })], state_file)
 
-    save_job_state(state, state_file)
+    _notify_state_change(job_id)
 
     print(f"🚫 Job {job_id} cancelled successfully")
 
@@ -365,25 +686,10 @@ async def cancel_job(job_id: str) -> Dict[str, Any]:
         "message": "Job cancelled successfully"
     }
 
-async def list_jobs(status_filter: Optional[str] = None) -> Dict[str, Any]:
-    """
-    List all submitted jobs with optional status filter.
-
-    Args:
-        status_filter: Optional status filter (submitted, queued, running, completed, cancelled)
-
-    Returns:
-        Dict containing list of jobs
-    """
-    state_file = get_job_state_file()
-    state = load_job_state(state_file)
-
+def _summarize_jobs(state: Dict[str, Any], status_filter: Optional[str]) -> Dict[str, Any]:
+    """Build the list_jobs response from already-refreshed job records."""
     jobs = []
     for job_id, job_info in state["jobs"].items():
-        # Update status before filtering
-        current_status = await simulate_job_progression(job_info)
-        job_info["status"] = current_status
-
         if status_filter and job_info["status"] != status_filter:
             continue
 
@@ -393,12 +699,9 @@ async def list_jobs(status_filter: Optional[str] = None) -> Dict[str, Any]:
             "submitted_at": job_info["submitted_at"],
             "input_file": job_info["input_file"],
             "priority": job_info["priority"],
-            "progress": calculate_progress(job_info)
+            "progress": job_info["progress"]
         })
 
-    # Save updated state
-    save_job_state(state, state_file)
-
     print(f"📋 Found {len(jobs)} jobs" + (f" with status '{status_filter}'" if status_filter else ""))
 
     return {
@@ -406,6 +709,172 @@ async def list_jobs(status_filter: Optional[str] = None) -> Dict[str, Any]:
         "total_count": len(jobs)
     }
 
+def _impl_list_jobs(status_filter: Optional[str] = None) -> Dict[str, Any]:
+    """Synchronous core of list_jobs, refreshing each job in turn."""
+    state_file = get_job_state_file()
+    state = get_cached_job_state(state_file)
+
+    events = []
+    for job_id, job_info in state["jobs"].items():
+        events.extend(_refresh_job(job_id, job_info))
+
+    # Journal all status changes in a single append
+    record_job_events(events, state_file)
+
+    return _summarize_jobs(state, status_filter)
+
+async def submit_job(
+    input_file: Union[str, Path],
+    priority: int = 5,
+    output_format: str = "tsv",
+    databases: Optional[str] = None,
+    notification_email: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    config: Optional[Dict[str, Any]] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Submit an InterProScan job to the background queue.
+
+    Args:
+        input_file: Path to protein FASTA file
+        priority: Job priority (1-10, higher is more important)
+        output_format: Output format (tsv, xml, json, gff3)
+        databases: Comma-separated list of databases to search
+        notification_email: Email for completion notification
+        tags: List of tags for job organization
+        config: Configuration dict (uses DEFAULT_CONFIG if not provided)
+        **kwargs: Override specific config parameters
+
+    Returns:
+        Dict containing:
+            - job_id: Unique job identifier
+            - estimated_completion: Estimated completion time
+            - status: Submission status
+
+    Example:
+        >>> result = await submit_job("input.fasta", priority=8)
+        >>> print(result['job_id'])
+    """
+    return _impl_submit_job(
+        input_file,
+        priority=priority,
+        output_format=output_format,
+        databases=databases,
+        notification_email=notification_email,
+        tags=tags,
+        config=config,
+        **kwargs
+    )
+
+async def get_job_status(job_id: str) -> Dict[str, Any]:
+    """
+    Get status of a submitted job.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Dict containing job status information
+
+    Example:
+        >>> status = await get_job_status("job_abc12345")
+        >>> print(status['job_status'])
+    """
+    return _impl_get_job_status(job_id)
+
+async def get_job_result(job_id: str, output_file: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Get results from a completed job.
+
+    Args:
+        job_id: Job identifier
+        output_file: Optional path to save results
+
+    Returns:
+        Dict containing job results
+
+    Example:
+        >>> result = await get_job_result("job_abc12345", "results.tsv")
+        >>> print(result['output_file'])
+    """
+    return _impl_get_job_result(job_id, output_file)
+
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a submitted job.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Dict containing cancellation status
+    """
+    return _impl_cancel_job(job_id)
+
+async def wait_for_state(
+    job_id: str,
+    target_state: str,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Wait until a job reaches target_state (or a terminal state) and return its status.
+
+    Instead of polling on a fixed interval, the wait wakes only when the job's
+    status is changed (e.g. by cancel_job) or when its next simulated transition
+    is due.
+
+    Args:
+        job_id: Job identifier
+        target_state: Status to wait for (queued, running, completed, ...)
+        timeout: Maximum seconds to wait (None waits indefinitely)
+
+    Returns:
+        Dict containing job status information, as from get_job_status
+
+    Raises:
+        TimeoutError: If the job has not reached the state within timeout
+    """
+    state_file = get_job_state_file()
+    changed = asyncio.Event()
+    _state_waiters.setdefault(job_id, set()).add(changed)
+
+    async def _wait() -> None:
+        while True:
+            events = []
+            job_info = _get_or_refresh_job(get_cached_job_state(state_file), job_id, events)
+            record_job_events(events, state_file)
+            if job_info["status"] == target_state or job_info["status"] in TERMINAL_JOB_STATES:
+                return
+
+            changed.clear()
+            try:
+                await asyncio.wait_for(changed.wait(), _next_transition_delay(job_info))
+            except asyncio.TimeoutError:
+                pass
+
+    try:
+        await asyncio.wait_for(_wait(), timeout)
+    finally:
+        waiters = _state_waiters[job_id]
+        waiters.discard(changed)
+        if not waiters:
+            del _state_waiters[job_id]
+
+    return _impl_get_job_status(job_id)
+
+async def list_jobs(status_filter: Optional[str] = None) -> Dict[str, Any]:
+    """
+    List all submitted jobs with optional status filter.
+
+    Args:
+        status_filter: Optional status filter (submitted, queued, running, completed, cancelled)
+
+    Returns:
+        Dict containing list of jobs
+    """
+    return _impl_list_jobs(status_filter)
+
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
@@ -440,62 +909,62 @@ def main():
 
     args = parser.parse_args()
 
-    async def run_command():
-        if args.create_dataset:
-            # Create test dataset
-            output_path = Path("examples/data/large_dataset.fasta")
-            print(f"📝 Creating test dataset with {args.create_dataset} sequences")
-            generate_large_protein_dataset(output_path, args.create_dataset)
-            print(f"✅ Dataset created at: {output_path}")
-            return
-
-        elif args.submit:
-            # Submit job
-            if not args.input:
-                parser.error("--input required when submitting job")
-
-            tags = args.tags.split(',') if args.tags else None
-            result = await submit_job(
-                input_file=args.input,
-                priority=args.priority,
-                output_format=args.format,
-                databases=args.databases,
-                notification_email=args.email,
-                tags=tags
-            )
-            print(f"✅ Job submitted: {result['job_id']}")
-
-        elif args.status:
-            # Get job status
-            result = await get_job_status(args.status)
-            print(f"Job Status: {result['job_status']}")
-            print(f"Progress: {result['progress']}%")
-
-        elif args.result:
-            # Get job result
-            result = await get_job_result(args.result, args.output)
-            if result['output_file']:
-                print(f"✅ Results saved to: {result['output_file']}")
-            else:
-                print("Results:")
-                print(result['results'][:500] + "..." if len(result['results']) > 500 else result['results'])
-
-        elif args.cancel:
-            # Cancel job
-            result = await cancel_job(args.cancel)
-            print(f"✅ Job cancelled: {result['job_id']}")
-
-        elif args.list:
-            # List jobs
-            result = await list_jobs(args.status_filter)
-            print(f"Jobs ({result['total_count']} total):")
-            for job in result['jobs']:
-                print(f"  {job['job_id']}: {job['status']} ({job['progress']}%) - {job['input_file']}")
-
+    if args.create_dataset:
+        # Create test dataset
+        output_path = Path("examples/data/large_dataset.fasta")
+        print(f"📝 Creating test dataset with {args.create_dataset} sequences")
+        generate_large_protein_dataset(output_path, args.create_dataset)
+        print(f"✅ Dataset created at: {output_path}")
+        return
+
+    elif args.submit:
+        # Submit job
+        if not args.input:
+            parser.error("--input required when submitting job")
+
+        tags = args.tags.split(',') if args.tags else None
+        result = _impl_submit_job(
+            input_file=args.input,
+            priority=args.priority,
+            output_format=args.format,
+            databases=args.databases,
+            notification_email=args.email,
+            tags=tags
+        )
+        print(f"✅ Job submitted: {result['job_id']}")
+
+    elif args.status:
+        # Get job status
+        result = _impl_get_job_status(args.status)
+        print(f"Job Status: {result['job_status']}")
+        print(f"Progress: {result['progress']}%")
+
+    elif args.result:
+        # Get job result
+        result = _impl_get_job_result(args.result, args.output)
+        if result['output_file']:
+            print(f"✅ Results saved to: {result['output_file']}")
         else:
-            parser.print_help()
+            print("Results:")
+            print(result['results'][:500] + "..." if len(result['results']) > 500 else result['results'])
+
+    elif args.cancel:
+        # Cancel job
+        result = _impl_cancel_job(args.cancel)
+        print(f"✅ Job cancelled: {result['job_id']}")
+
+    elif args.list:
+        # List jobs
+        result = _impl_list_jobs(args.status_filter)
+        lines = [f"Jobs ({result['total_count']} total):"]
+        lines.extend(
+            f"  {job['job_id']}: {job['status']} ({job['progress']}%) - {job['input_file']}"
+            for job in result['jobs']
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    asyncio.run(run_command())
+    else:
+        parser.print_help()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -9,7 +9,7 @@ __version__ = "1.0.0"
 
 # Make key functions available at package level
 from .io import load_fasta, save_tsv_output, save_json_output, load_config
-from .parsers import parse_interpro_tsv, generate_summary_stats
+from .parsers import parse_interpro_tsv, parse_interpro_tsv_file, generate_summary_stats
 from .utils import estimate_processing_time, generate_job_id, format_timestamp
 from .mock import generate_mock_interpro_tsv, create_sample_fasta_data
 
@@ -22,6 +22,7 @@ __all__ = [
 
     # Parsers
     'parse_interpro_tsv',
+    'parse_interpro_tsv_file',
     'generate_summary_stats',
 
     # Utilities
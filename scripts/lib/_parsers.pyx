@@ -0,0 +1,152 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled InterProScan TSV parser.
+
+Optional accelerator for parsers.parse_interpro_tsv; the pure-Python
+implementation is used whenever this extension is not built. quick_setup.sh
+builds it in place; to build by hand (needs Cython and a C compiler):
+
+    cythonize -i -3 scripts/lib/_parsers.pyx
+"""
+
+from csv import Error as CsvError
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport memchr
+from sys import intern
+
+cdef enum:
+    NUM_FIELDS = 15
+
+# Raised by csv.reader for a '\r' followed by more text on the same line
+_BARE_CR_MESSAGE = "new-line character seen in unquoted field - do you need to open the file in universal-newline mode?"
+
+# Mirrors the classification sets in parsers.py
+_DOMAIN_ANALYSES = frozenset(('Pfam', 'SMART', 'GENE3D', 'SUPERFAMILY'))
+_FAMILY_ANALYSES = frozenset(('PRINTS', 'PANTHER', 'ProSiteProfiles'))
+
+
+cdef inline int split_row(const char* buf, Py_ssize_t n,
+                          Py_ssize_t* starts, Py_ssize_t* ends):
+    """Find the first NUM_FIELDS tab-separated fields; return how many were found."""
+    cdef Py_ssize_t pos = 0
+    cdef int count = 0
+    cdef const char* tab
+    while count < NUM_FIELDS:
+        starts[count] = pos
+        tab = <const char*>memchr(buf + pos, b'\t', n - pos)
+        if tab == NULL:
+            ends[count] = n
+            return count + 1
+        ends[count] = tab - buf
+        pos = ends[count] + 1
+        count += 1
+    return count
+
+
+cdef inline str field(const char* buf, Py_ssize_t* starts, Py_ssize_t* ends, int i):
+    return PyUnicode_DecodeUTF8(buf + starts[i], ends[i] - starts[i], NULL)
+
+
+def parse_interpro_tsv(bytes data):
+    """Parse UTF-8 InterProScan TSV bytes; same output as parsers.parse_interpro_tsv."""
+    cdef const char* buf = data
+    cdef Py_ssize_t size = len(data)
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t line_end, n
+    cdef const char* newline
+    cdef const char* line
+    cdef const char* cr
+    cdef Py_ssize_t i
+    cdef Py_ssize_t starts[NUM_FIELDS]
+    cdef Py_ssize_t ends[NUM_FIELDS]
+    cdef dict sequences = {}
+    cdef dict seq_record
+    cdef set domains = set()
+    cdef set families = set()
+    cdef set go_terms = set()
+    cdef set pathways = set()
+
+    while pos < size:
+        newline = <const char*>memchr(buf + pos, b'\n', size - pos)
+        line_end = size if newline == NULL else newline - buf
+        line = buf + pos
+        n = line_end - pos
+        pos = line_end + 1
+
+        # Like csv.reader, a record ends at its first '\r'; only more '\r's may follow it
+        cr = <const char*>memchr(line, b'\r', n)
+        if cr != NULL:
+            for i in range(cr - line + 1, n):
+                if line[i] != b'\r':
+                    raise CsvError(_BARE_CR_MESSAGE)
+            n = cr - line
+        if n == 0 or line[0] == b'#':
+            continue
+        if split_row(line, n, starts, ends) < NUM_FIELDS:
+            continue
+
+        seq_id = field(line, starts, ends, 0)
+        analysis = intern(field(line, starts, ends, 3))
+        signature_desc = intern(field(line, starts, ends, 5))
+        interpro_acc = field(line, starts, ends, 11)
+        interpro_desc = field(line, starts, ends, 12)
+        go_annotation = field(line, starts, ends, 13)
+        pathway_annotation = field(line, starts, ends, 14)
+
+        seq_record = sequences.get(seq_id)
+        if seq_record is None:
+            seq_record = {
+                'md5': field(line, starts, ends, 1),
+                'length': field(line, starts, ends, 2),
+                'domains': set(),
+                'families': set(),
+                'go_terms': set(),
+                'pathways': set(),
+                'annotations': []
+            }
+            sequences[seq_id] = seq_record
+
+        seq_record['annotations'].append({
+            'analysis': analysis,
+            'signature_acc': field(line, starts, ends, 4),
+            'signature_desc': signature_desc,
+            'start': field(line, starts, ends, 6),
+            'stop': field(line, starts, ends, 7),
+            'score': field(line, starts, ends, 8),
+            'interpro_acc': intern(interpro_acc) if interpro_acc != '-' else None,
+            'interpro_desc': intern(interpro_desc) if interpro_desc != '-' else None
+        })
+
+        if analysis in _DOMAIN_ANALYSES:
+            domains.add(signature_desc)
+            seq_record['domains'].add(signature_desc)
+        elif analysis in _FAMILY_ANALYSES:
+            families.add(signature_desc)
+            seq_record['families'].add(signature_desc)
+
+        if go_annotation and go_annotation != '-':
+            for go in go_annotation.split(','):
+                go_id, sep, _ = go.partition('|')
+                if not sep:
+                    continue
+                go_terms.add(go_id)
+                seq_record['go_terms'].add(go_id)
+
+        if pathway_annotation and pathway_annotation != '-':
+            pathways.add(pathway_annotation)
+            seq_record['pathways'].add(pathway_annotation)
+
+    for seq_record in sequences.values():
+        seq_record['domains'] = list(seq_record['domains'])
+        seq_record['families'] = list(seq_record['families'])
+        seq_record['go_terms'] = list(seq_record['go_terms'])
+        seq_record['pathways'] = list(seq_record['pathways'])
+
+    return {
+        'sequences': sequences,
+        'domains': list(domains),
+        'families': list(families),
+        'go_terms': list(go_terms),
+        'pathways': list(pathways)
+    }
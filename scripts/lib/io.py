@@ -5,8 +5,28 @@ These are extracted and simplified from repo code to minimize dependencies.
 """
 
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Union, List, Tuple, Dict, Any
+from typing import IO, Union, List, Tuple, Dict, Any
+
+# orjson is an optional speedup; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _json_loads = json.loads
+
+
+# Bytes dropped from sequence bodies when parsing FASTA records
+_FASTA_WHITESPACE = b' \t\r\n'
 
 
 def load_fasta(file_path: Union[str, Path]) -> List[Tuple[str, str]]:
@@ -21,42 +41,66 @@ def load_fasta(file_path: Union[str, Path]) -> List[Tuple[str, str]]:
         raise FileNotFoundError(f"FASTA file not found: {file_path}")
 
     sequences = []
-    header = None
-    sequence = ""
 
-    with open(file_path) as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('>'):
-                if header is not None:
-                    sequences.append((header, sequence))
-                header = line
-                sequence = ""
-            else:
-                sequence += line
-
-        if header is not None:
-            sequences.append((header, sequence))
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return sequences  # mmap cannot map an empty file
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Records start at a '>' beginning a line; scan for them in C via find()
+            start = 0 if mm[:1] == b'>' else mm.find(b'\n>')
+            if start == -1:
+                return sequences
+            if start:
+                start += 1
+
+            while start != -1:
+                next_record = mm.find(b'\n>', start)
+                end = size if next_record == -1 else next_record + 1
+
+                header_end = mm.find(b'\n', start, end)
+                if header_end == -1:
+                    header_end = end
+
+                header = mm[start:header_end].rstrip().decode()
+                sequence = mm[header_end:end].translate(None, _FASTA_WHITESPACE).decode()
+                sequences.append((header, sequence))
+
+                start = -1 if next_record == -1 else next_record + 1
 
     return sequences
 
 
+def _open_for_write(file_path: Path, mode: str = 'w') -> IO:
+    """
+    Open file_path for writing, creating its parent directories only when missing.
+
+    Saving into an existing directory costs a single open call, with no mkdir
+    first; if the directory is missing (including one removed since the last
+    save) it is created and the open retried.
+    """
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, mode)
+
+
 def save_tsv_output(data: str, file_path: Union[str, Path]) -> None:
     """Save TSV data to file."""
     file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, 'w') as f:
+    with _open_for_write(file_path) as f:
         f.write(data)
 
 
 def save_json_output(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
     """Save JSON data to file with pretty formatting."""
     file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with _open_for_write(file_path, 'wb') as f:
+        f.write(_json_dumps(data))
 
 
 def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
@@ -67,9 +111,8 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     try:
-        with open(config_path) as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return _json_loads(config_path.read_bytes())
+    except ValueError as e:
         raise ValueError(f"Invalid JSON in config file {config_path}: {e}")
 
 
@@ -80,8 +123,6 @@ def save_execution_log(
 ) -> Path:
     """Save execution log with timing and metadata."""
     output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     log_file = output_dir / filename
 
     # Convert to JSON-serializable format
@@ -100,6 +141,41 @@ def save_execution_log(
     return log_file
 
 
+def _stream_fasta_stats(file_path: Path) -> Dict[str, Any]:
+    """Compute FASTA sequence statistics in one streaming pass without keeping sequences."""
+    count = 0
+    total = 0
+    min_length = None
+    max_length = 0
+    current = None  # Length of the record being read; None before the first header
+
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line[:1] == b'>':
+                if current is not None:
+                    count += 1
+                    total += current
+                    min_length = current if min_length is None else min(min_length, current)
+                    max_length = max(max_length, current)
+                current = 0
+            elif current is not None:
+                current += len(line.rstrip())
+
+    if current is not None:
+        count += 1
+        total += current
+        min_length = current if min_length is None else min(min_length, current)
+        max_length = max(max_length, current)
+
+    return {
+        "sequence_count": count,
+        "total_length": total,
+        "avg_length": total / count if count else 0,
+        "min_length": min_length or 0,
+        "max_length": max_length
+    }
+
+
 def validate_fasta_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Validate FASTA file format and return basic statistics.
@@ -117,26 +193,16 @@ def validate_fasta_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         }
 
     try:
-        sequences = load_fasta(file_path)
+        stats = _stream_fasta_stats(file_path)
 
-        if not sequences:
+        if not stats["sequence_count"]:
             return {
                 "valid": False,
                 "error": "No sequences found in file",
                 "stats": {}
             }
 
-        # Calculate statistics
-        sequence_lengths = [len(seq) for _, seq in sequences]
-
-        stats = {
-            "sequence_count": len(sequences),
-            "total_length": sum(sequence_lengths),
-            "avg_length": sum(sequence_lengths) / len(sequence_lengths),
-            "min_length": min(sequence_lengths),
-            "max_length": max(sequence_lengths),
-            "file_size": file_path.stat().st_size
-        }
+        stats["file_size"] = file_path.stat().st_size
 
         return {
             "valid": True,
@@ -149,4 +215,4 @@ def validate_fasta_file(file_path: Union[str, Path]) -> Dict[str, Any]:
             "valid": False,
             "error": f"Error reading FASTA file: {str(e)}",
             "stats": {}
-        }
\ No newline at end of file
+        }
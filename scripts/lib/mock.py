@@ -4,12 +4,27 @@ Mock data generation functions.
 These provide realistic test data and responses for demonstration purposes.
 """
 
+import functools
+import io
 import random
 from datetime import datetime
 from typing import List, Tuple, Dict, Any
 from pathlib import Path
 
 
+# Standard amino acid alphabet for generated sequences
+AMINO_ACIDS = tuple('ACDEFGHIKLMNPQRSTVWY')
+
+# Mock InterProScan TSV header; rows follow on their own lines
+_TSV_HEADER = (
+    "# InterProScan version 5.59-91.0\n"
+    "# What is InterProScan? InterProScan is a sequence analysis application (nucleotide and protein sequences) that combines different protein signature recognition methods from the InterPro database.\n"
+    "# Version 5.59-91.0\n"
+    "# Analysis Date: {timestamp}\n"
+    "\n"
+    "# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways"
+)
+
 # Sample protein data for generating mock results
 SAMPLE_PROTEINS = [
     {
@@ -75,6 +90,13 @@ def create_sample_fasta_data(
     Returns:
         List of (header, sequence) tuples
     """
+    return list(_sample_fasta_data(num_proteins, include_custom))
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_fasta_data(num_proteins: int, include_custom: bool) -> Tuple[Tuple[str, str], ...]:
+    """Build the sample records; seeded per arguments so results are cacheable."""
+    rng = random.Random(f"{num_proteins}:{include_custom}")
     sequences = []
 
     if include_custom and num_proteins > 0:
@@ -85,19 +107,50 @@ def create_sample_fasta_data(
 
     # Generate additional random proteins if needed
     if num_proteins > len(SAMPLE_PROTEINS):
-        amino_acids = 'ACDEFGHIKLMNPQRSTVWY'
         remaining = num_proteins - len(SAMPLE_PROTEINS)
 
         for i in range(remaining):
             protein_id = f"PROTEIN_{len(SAMPLE_PROTEINS) + i + 1:03d}"
             # Generate random sequence (100-400 amino acids)
-            length = random.randint(100, 400)
-            sequence = ''.join(random.choice(amino_acids) for _ in range(length))
+            length = rng.randint(100, 400)
+            sequence = ''.join(rng.choices(AMINO_ACIDS, k=length))
 
             header = f">{protein_id}|Generated protein {i+1}|Test organism"
             sequences.append((header, sequence))
 
-    return sequences
+    return tuple(sequences)
+
+
+def _build_cache(index: int, protein: Dict[str, Any]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Precompute the fixed parts of a sample protein's mock TSV rows.
+
+    Each row is a (prefix, suffix) pair; the date and InterPro accession
+    are the only per-call fields and go between them.
+    """
+    md5_hash = f"hash{index+1}{'abc123' if index == 0 else 'def456' if index == 1 else 'ghi789'}"
+    seq_length = len(protein["sequence"])
+
+    def fragments(entry, interpro_desc, go_terms, pathways):
+        prefix = "\t".join([
+            protein["id"], md5_hash, str(seq_length), entry["analysis"], entry["acc"],
+            entry["name"], str(entry["start"]), str(entry["stop"]), entry["score"], "T", ""
+        ])
+        return prefix, "\t".join([interpro_desc, go_terms, pathways])
+
+    # Domains carry the first two GO terms and first pathway, families the rest of the GO terms
+    go_short = ",".join(protein["go_terms"][:2])
+    go_long = ",".join(protein["go_terms"][2:]) if len(protein["go_terms"]) > 2 else "-"
+    pathway_short = ",".join(protein["pathways"][:1]) if protein["pathways"] else "-"
+
+    domain_rows = [fragments(domain, f"{domain['name']} domain", go_short, pathway_short)
+                   for domain in protein["domains"]]
+    family_rows = [fragments(family, f"{family['name']} family", go_long, "-")
+                   for family in protein["families"]]
+    return domain_rows, family_rows
+
+
+_SAMPLE_CACHE = [_build_cache(i, p) for i, p in enumerate(SAMPLE_PROTEINS)]
 
 
 def generate_mock_interpro_tsv(
@@ -117,73 +170,26 @@ def generate_mock_interpro_tsv(
     if timestamp is None:
         timestamp = datetime.now().strftime("%Y-%m-%d")
 
-    # TSV header
-    lines = [
-        "# InterProScan version 5.59-91.0",
-        "# What is InterProScan? InterProScan is a sequence analysis application (nucleotide and protein sequences) that combines different protein signature recognition methods from the InterPro database.",
-        "# Version 5.59-91.0",
-        f"# Analysis Date: {timestamp}",
-        "",
-        "# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways"
-    ]
+    return _mock_interpro_tsv(num_sequences, timestamp)
+
+
+@functools.lru_cache(maxsize=32)
+def _mock_interpro_tsv(num_sequences: int, timestamp: str) -> str:
+    """Build the mock TSV; seeded per arguments so results are cacheable."""
+    rng = random.Random(f"{num_sequences}:{timestamp}")
+
+    buf = io.StringIO()
+    w = buf.write
+
+    # Every row after the header is written with its leading newline
+    w(_TSV_HEADER.format(timestamp=timestamp))
 
     # Generate data for each sequence
-    for i in range(min(num_sequences, len(SAMPLE_PROTEINS))):
-        protein = SAMPLE_PROTEINS[i]
-        seq_id = protein["id"]
-        md5_hash = f"hash{i+1}{'abc123' if i == 0 else 'def456' if i == 1 else 'ghi789'}"
-        seq_length = len(protein["sequence"])
-
-        # Add domain annotations
-        for domain in protein["domains"]:
-            interpro_acc = f"IPR{random.randint(100000, 999999)}"
-            interpro_desc = f"{domain['name']} domain"
-            go_terms = ",".join(protein["go_terms"][:2])  # Limit GO terms per line
-            pathways = ",".join(protein["pathways"][:1]) if protein["pathways"] else "-"
-
-            line = "\t".join([
-                seq_id,
-                md5_hash,
-                str(seq_length),
-                domain["analysis"],
-                domain["acc"],
-                domain["name"],
-                str(domain["start"]),
-                str(domain["stop"]),
-                domain["score"],
-                "T",
-                timestamp,
-                interpro_acc,
-                interpro_desc,
-                go_terms,
-                pathways
-            ])
-            lines.append(line)
-
-        # Add family annotations
-        for family in protein["families"]:
-            interpro_acc = f"IPR{random.randint(100000, 999999)}"
-            interpro_desc = f"{family['name']} family"
-            go_terms = ",".join(protein["go_terms"][2:]) if len(protein["go_terms"]) > 2 else "-"
-
-            line = "\t".join([
-                seq_id,
-                md5_hash,
-                str(seq_length),
-                family["analysis"],
-                family["acc"],
-                family["name"],
-                str(family["start"]),
-                str(family["stop"]),
-                family["score"],
-                "T",
-                timestamp,
-                interpro_acc,
-                interpro_desc,
-                go_terms,
-                "-"
-            ])
-            lines.append(line)
+    for domain_rows, family_rows in _SAMPLE_CACHE[:max(num_sequences, 0)]:
+        for prefix, suffix in domain_rows:
+            w(f"\n{prefix}{timestamp}\tIPR{rng.randint(100000, 999999)}\t{suffix}")
+        for prefix, suffix in family_rows:
+            w(f"\n{prefix}{timestamp}\tIPR{rng.randint(100000, 999999)}\t{suffix}")
 
     # Add random proteins if needed
     if num_sequences > len(SAMPLE_PROTEINS):
@@ -191,26 +197,23 @@ def generate_mock_interpro_tsv(
         for i in range(remaining):
             seq_id = f"PROTEIN_{len(SAMPLE_PROTEINS) + i + 1:03d}"
             md5_hash = f"hash{len(SAMPLE_PROTEINS) + i + 1}xyz"
-            seq_length = random.randint(100, 400)
+            seq_length = rng.randint(100, 400)
 
             # Random domain
             domain_types = ["Pfam", "SMART", "GENE3D"]
-            domain_type = random.choice(domain_types)
-            domain_acc = f"PF{random.randint(10000, 99999)}"
+            domain_type = rng.choice(domain_types)
+            domain_acc = f"PF{rng.randint(10000, 99999)}"
             domain_name = f"Random_Domain_{i+1}"
-            start_pos = random.randint(1, 50)
-            stop_pos = start_pos + random.randint(100, 200)
-            score = f"{random.uniform(1e-15, 1e-5):.1E}"
-
-            line = "\t".join([
-                seq_id, md5_hash, str(seq_length), domain_type, domain_acc, domain_name,
-                str(start_pos), str(stop_pos), score, "T", timestamp,
-                f"IPR{random.randint(100000, 999999)}", f"{domain_name} domain",
-                "GO:0003824|catalytic activity", "-"
-            ])
-            lines.append(line)
-
-    return "\n".join(lines)
+            start_pos = rng.randint(1, 50)
+            stop_pos = start_pos + rng.randint(100, 200)
+            score = f"{rng.uniform(1e-15, 1e-5):.1E}"
+
+            w(f"\n{seq_id}\t{md5_hash}\t{seq_length}\t{domain_type}\t{domain_acc}\t{domain_name}"
+              f"\t{start_pos}\t{stop_pos}\t{score}\tT\t{timestamp}"
+              f"\tIPR{rng.randint(100000, 999999)}\t{domain_name} domain"
+              f"\tGO:0003824|catalytic activity\t-")
+
+    return buf.getvalue()
 
 
 def generate_mock_job_data() -> Dict[str, Any]:
@@ -2,9 +2,49 @@
 InterProScan result parsers.
 
 These are extracted and simplified from repo parsing code to minimize dependencies.
+
+Every per-sequence record produced by parse_interpro_tsv() and
+filter_results_by_score() carries all of 'md5', 'length', 'domains',
+'families', 'go_terms', 'pathways' and 'annotations', so consumers index
+those keys directly.
 """
 
-from typing import Dict, Any, List, Set
+import csv
+import io
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Set, Union
+
+# Compiled parser (see _parsers.pyx) is optional; falls back to the loop below
+try:
+    from ._parsers import parse_interpro_tsv as _c_impl
+except ImportError:
+    _c_impl = None
+
+# pandas is optional; its C CSV reader takes over for large TSV inputs
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+# InterProScan TSV columns, in file order
+TSV_COLUMNS = [
+    'seq_id', 'md5', 'length', 'analysis', 'sig_acc', 'sig_desc', 'start', 'stop',
+    'score', 'status', 'date', 'ipr_acc', 'ipr_desc', 'go', 'pathway'
+]
+
+# Analysis types classified as domains vs families
+_DOMAIN_ANALYSES = frozenset(('Pfam', 'SMART', 'GENE3D', 'SUPERFAMILY'))
+_FAMILY_ANALYSES = frozenset(('PRINTS', 'PANTHER', 'ProSiteProfiles'))
+
+# Small inputs are not worth the encode round-trip into the compiled parser
+C_MIN_CONTENT_SIZE = 64 << 10
+
+# The dict-of-lists output has to be built in Python either way, so the line
+# parser stays faster on typical outputs; pandas only takes over for huge ones
+PANDAS_MIN_CONTENT_SIZE = 64 << 20
 
 
 def parse_interpro_tsv(tsv_content: str) -> Dict[str, Any]:
@@ -19,37 +59,66 @@ def parse_interpro_tsv(tsv_content: str) -> Dict[str, Any]:
     Returns:
         Dict with parsed sequences, domains, families, and GO terms
     """
-    lines = tsv_content.strip().split('\n')
+    if _c_impl is not None and len(tsv_content) >= C_MIN_CONTENT_SIZE:
+        return _c_impl(tsv_content.encode('utf-8'))
+
+    if pd is not None and len(tsv_content) >= PANDAS_MIN_CONTENT_SIZE:
+        return _parse_interpro_tsv_pandas(tsv_content)
+
+    # QUOTE_NONE keeps quote characters in descriptions as literal text
+    return _consume_rows(csv.reader(io.StringIO(tsv_content), delimiter='\t', quoting=csv.QUOTE_NONE))
+
+
+def parse_interpro_tsv_file(
+    file_path: Union[str, Path],
+    buffer_size: int = 1 << 20
+) -> Dict[str, Any]:
+    """
+    Parse an InterProScan TSV file without loading it into memory.
+
+    Args:
+        file_path: Path to the TSV file
+        buffer_size: Read buffer size in bytes
+
+    Returns:
+        Same structure as parse_interpro_tsv()
+    """
+    with open(file_path, 'r', buffering=buffer_size, newline='') as f:
+        return _consume_rows(csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE))
+
+
+def _consume_rows(reader: Iterable[List[str]]) -> Dict[str, Any]:
+    """Build parsed results from TSV rows; shared by the string and file parsers."""
     sequences = {}
     domains = set()
     families = set()
     go_terms = set()
     pathways = set()
 
-    for line in lines:
-        if line.startswith('#') or not line.strip():
+    for parts in reader:
+        if not parts or parts[0].startswith('#'):
             continue
 
-        parts = line.split('\t')
         if len(parts) < 15:
             continue
 
-        # Extract fields
+        # Extract fields; the length check above guarantees all 15 are present
         seq_id = parts[0]
         md5 = parts[1]
         seq_length = parts[2]
-        analysis = parts[3]
+        # Intern the fields that repeat across rows so they share one string object
+        analysis = sys.intern(parts[3])
         signature_acc = parts[4]
-        signature_desc = parts[5]
+        signature_desc = sys.intern(parts[5])
         start_loc = parts[6]
         stop_loc = parts[7]
         score = parts[8]
         status = parts[9]
         date = parts[10]
-        interpro_acc = parts[11] if len(parts) > 11 and parts[11] != '-' else None
-        interpro_desc = parts[12] if len(parts) > 12 and parts[12] != '-' else None
-        go_annotation = parts[13] if len(parts) > 13 and parts[13] != '-' else None
-        pathway_annotation = parts[14] if len(parts) > 14 and parts[14] != '-' else None
+        interpro_acc = sys.intern(parts[11]) if parts[11] != '-' else None
+        interpro_desc = sys.intern(parts[12]) if parts[12] != '-' else None
+        go_annotation = parts[13] if parts[13] != '-' else None
+        pathway_annotation = parts[14] if parts[14] != '-' else None
 
         # Initialize sequence record
         if seq_id not in sequences:
@@ -77,40 +146,141 @@ def parse_interpro_tsv(tsv_content: str) -> Dict[str, Any]:
         sequences[seq_id]['annotations'].append(annotation)
 
         # Classify domains vs families based on analysis type
-        if analysis in ['Pfam', 'SMART', 'GENE3D', 'SUPERFAMILY']:
+        if analysis in _DOMAIN_ANALYSES:
             domains.add(signature_desc)
             sequences[seq_id]['domains'].add(signature_desc)
-        elif analysis in ['PRINTS', 'PANTHER', 'ProSiteProfiles']:
+        elif analysis in _FAMILY_ANALYSES:
             families.add(signature_desc)
             sequences[seq_id]['families'].add(signature_desc)
 
         # Parse GO terms
-        if go_annotation and go_annotation != '-':
-            go_list = go_annotation.split(',')
-            for go in go_list:
-                if '|' in go:
-                    go_id = go.split('|')[0]
-                    go_terms.add(go_id)
-                    sequences[seq_id]['go_terms'].add(go_id)
+        if go_annotation:
+            for go in go_annotation.split(','):
+                go_id, sep, _ = go.partition('|')
+                if not sep:
+                    continue
+                go_terms.add(go_id)
+                sequences[seq_id]['go_terms'].add(go_id)
 
         # Parse pathways
-        if pathway_annotation and pathway_annotation != '-':
+        if pathway_annotation:
             pathways.add(pathway_annotation)
             sequences[seq_id]['pathways'].add(pathway_annotation)
 
-    # Convert sets to lists for JSON serialization
-    for seq_id in sequences:
-        sequences[seq_id]['domains'] = list(sequences[seq_id]['domains'])
-        sequences[seq_id]['families'] = list(sequences[seq_id]['families'])
-        sequences[seq_id]['go_terms'] = list(sequences[seq_id]['go_terms'])
-        sequences[seq_id]['pathways'] = list(sequences[seq_id]['pathways'])
+    return _finalize_lists({
+        'sequences': sequences,
+        'domains': domains,
+        'families': families,
+        'go_terms': go_terms,
+        'pathways': pathways
+    })
+
+
+# Set-valued fields at both the top level and per sequence
+_LIST_FIELDS = ('domains', 'families', 'go_terms', 'pathways')
+
+
+def _finalize_lists(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the set-valued fields of parsed data to lists, in place, for JSON serialization."""
+    for seq_data in data['sequences'].values():
+        for key in _LIST_FIELDS:
+            seq_data[key] = list(seq_data[key])
+    for key in _LIST_FIELDS:
+        data[key] = list(data[key])
+    return data
+
+
+# Rows _consume_rows keeps: first field not a comment, and at least 15 tab-separated fields.
+# '#' may appear in descriptions, so only a line-leading one marks a comment.
+_TSV_DATA_ROW_RE = re.compile(r'^(?!#)(?:[^\t\n]*\t){14}[^\n]*', re.MULTILINE)
+
+
+def _parse_interpro_tsv_pandas(tsv_content: str) -> Dict[str, Any]:
+    """Vectorized parse_interpro_tsv using pandas.read_csv; same output structure."""
+    # read_csv reads a missing trailing field and an empty one alike, so rows are
+    # selected up front, in C, by the line parser's rules
+    rows = _TSV_DATA_ROW_RE.findall(tsv_content)
+    if not rows:
+        return _consume_rows(())
+
+    df = pd.read_csv(
+        io.StringIO('\n'.join(rows)),
+        sep='\t',
+        header=None,
+        names=TSV_COLUMNS,
+        usecols=range(len(TSV_COLUMNS)),
+        dtype=str,
+        keep_default_na=False,
+        # QUOTE_NONE keeps quote characters in descriptions as literal text, as in the line parser
+        quoting=csv.QUOTE_NONE,
+        engine='c'
+    )
+
+    domain_mask = df['analysis'].isin(_DOMAIN_ANALYSES)
+    family_mask = df['analysis'].isin(_FAMILY_ANALYSES)
+
+    # One row per GO term that carries an "ID|name" pair
+    go = df.loc[df['go'] != '-', ['seq_id', 'go']]
+    go = go.assign(go=go['go'].str.split(',')).explode('go')
+    go = go[go['go'].str.contains('|', regex=False)]
+    go = go.assign(go_id=go['go'].str.split('|').str[0])
+
+    # Like the line parser, '-' and empty both mean no pathway
+    pathway = df.loc[~df['pathway'].isin(('-', '')), ['seq_id', 'pathway']]
+
+    # Output key -> source column for each per-sequence annotation record
+    annotation_columns = {
+        'analysis': 'analysis',
+        'signature_acc': 'sig_acc',
+        'signature_desc': 'sig_desc',
+        'start': 'start',
+        'stop': 'stop',
+        'score': 'score',
+        'interpro_acc': 'ipr_acc',
+        'interpro_desc': 'ipr_desc'
+    }
+    annotation_values = []
+    for column in annotation_columns.values():
+        values = df[column].astype(object)
+        if column in ('ipr_acc', 'ipr_desc'):
+            values = values.where(values != '-', None)
+        annotation_values.append(values.tolist())
+
+    def unique_by_seq(frame, column):
+        grouped = {}
+        pairs = frame[['seq_id', column]].drop_duplicates()
+        for seq_id, value in zip(pairs['seq_id'], pairs[column]):
+            grouped.setdefault(seq_id, []).append(value)
+        return grouped
+
+    seq_domains = unique_by_seq(df.loc[domain_mask], 'sig_desc')
+    seq_families = unique_by_seq(df.loc[family_mask], 'sig_desc')
+    seq_go_terms = unique_by_seq(go, 'go_id')
+    seq_pathways = unique_by_seq(pathway, 'pathway')
+
+    # One pass over plain records; per-group DataFrame slicing dominates otherwise
+    sequences = {}
+    firsts = df.drop_duplicates('seq_id')
+    for seq_id, md5, seq_length in zip(firsts['seq_id'], firsts['md5'], firsts['length']):
+        sequences[seq_id] = {
+            'md5': md5,
+            'length': seq_length,
+            'domains': seq_domains.get(seq_id, []),
+            'families': seq_families.get(seq_id, []),
+            'go_terms': seq_go_terms.get(seq_id, []),
+            'pathways': seq_pathways.get(seq_id, []),
+            'annotations': []
+        }
+    keys = tuple(annotation_columns)
+    for seq_id, row in zip(df['seq_id'].tolist(), zip(*annotation_values)):
+        sequences[seq_id]['annotations'].append(dict(zip(keys, row)))
 
     return {
         'sequences': sequences,
-        'domains': list(domains),
-        'families': list(families),
-        'go_terms': list(go_terms),
-        'pathways': list(pathways)
+        'domains': list(df.loc[domain_mask, 'sig_desc'].unique()),
+        'families': list(df.loc[family_mask, 'sig_desc'].unique()),
+        'go_terms': list(go['go_id'].unique()),
+        'pathways': list(pathway['pathway'].unique())
     }
 
 
@@ -147,17 +317,17 @@ def generate_summary_stats(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     # Sequence-level statistics
     sequences_with_annotations = 0
     total_annotations = 0
-    domains_per_sequence = []
-    families_per_sequence = []
+    total_domains = 0
+    total_families = 0
 
-    for seq_id, seq_data in sequences.items():
-        annotations = seq_data.get('annotations', [])
+    for seq_data in sequences.values():
+        annotations = seq_data['annotations']
         if annotations:
             sequences_with_annotations += 1
             total_annotations += len(annotations)
 
-        domains_per_sequence.append(len(seq_data.get('domains', [])))
-        families_per_sequence.append(len(seq_data.get('families', [])))
+        total_domains += len(seq_data['domains'])
+        total_families += len(seq_data['families'])
 
     avg_annotations_per_sequence = (
         total_annotations / total_sequences if total_sequences > 0 else 0
@@ -172,8 +342,8 @@ def generate_summary_stats(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         'sequences_with_annotations': sequences_with_annotations,
         'total_annotations': total_annotations,
         'avg_annotations_per_sequence': round(avg_annotations_per_sequence, 2),
-        'avg_domains_per_sequence': round(sum(domains_per_sequence) / len(domains_per_sequence), 2) if domains_per_sequence else 0,
-        'avg_families_per_sequence': round(sum(families_per_sequence) / len(families_per_sequence), 2) if families_per_sequence else 0,
+        'avg_domains_per_sequence': round(total_domains / total_sequences, 2),
+        'avg_families_per_sequence': round(total_families / total_sequences, 2),
         'annotation_coverage': round(sequences_with_annotations / total_sequences * 100, 1) if total_sequences > 0 else 0
     }
 
@@ -197,6 +367,9 @@ def filter_results_by_score(
     if not parsed_data.get('sequences'):
         return parsed_data
 
+    if analysis_types:
+        analysis_types = frozenset(analysis_types)
+
     filtered_sequences = {}
     all_domains = set()
     all_families = set()
@@ -210,7 +383,7 @@ def filter_results_by_score(
         seq_go_terms = set()
         seq_pathways = set()
 
-        for annotation in seq_data.get('annotations', []):
+        for annotation in seq_data['annotations']:
             # Filter by analysis type
             if analysis_types and annotation['analysis'] not in analysis_types:
                 continue
@@ -228,32 +401,33 @@ def filter_results_by_score(
             filtered_annotations.append(annotation)
 
             # Re-classify domains and families
-            if annotation['analysis'] in ['Pfam', 'SMART', 'GENE3D', 'SUPERFAMILY']:
+            if annotation['analysis'] in _DOMAIN_ANALYSES:
                 seq_domains.add(annotation['signature_desc'])
                 all_domains.add(annotation['signature_desc'])
-            elif annotation['analysis'] in ['PRINTS', 'PANTHER', 'ProSiteProfiles']:
+            elif annotation['analysis'] in _FAMILY_ANALYSES:
                 seq_families.add(annotation['signature_desc'])
                 all_families.add(annotation['signature_desc'])
 
         # Only include sequences with remaining annotations
         if filtered_annotations:
             filtered_sequences[seq_id] = {
-                **seq_data,
+                'md5': seq_data['md5'],
+                'length': seq_data['length'],
                 'annotations': filtered_annotations,
-                'domains': list(seq_domains),
-                'families': list(seq_families),
-                'go_terms': list(seq_go_terms),
-                'pathways': list(seq_pathways)
+                'domains': seq_domains,
+                'families': seq_families,
+                'go_terms': seq_go_terms,
+                'pathways': seq_pathways
             }
 
             # Collect GO terms and pathways from original data for filtered sequences
-            all_go_terms.update(seq_data.get('go_terms', []))
-            all_pathways.update(seq_data.get('pathways', []))
+            all_go_terms.update(seq_data['go_terms'])
+            all_pathways.update(seq_data['pathways'])
 
-    return {
+    return _finalize_lists({
         'sequences': filtered_sequences,
-        'domains': list(all_domains),
-        'families': list(all_families),
-        'go_terms': list(all_go_terms),
-        'pathways': list(all_pathways)
-    }
\ No newline at end of file
+        'domains': all_domains,
+        'families': all_families,
+        'go_terms': all_go_terms,
+        'pathways': all_pathways
+    })
\ No newline at end of file
@@ -4,15 +4,21 @@ General utilities for MCP scripts.
 These are extracted and simplified from repo utility code to minimize dependencies.
 """
 
-import uuid
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Union
 
 
+# Characters not allowed in filenames, mapped to underscores
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+
+
 def generate_job_id() -> str:
     """Generate unique job identifier."""
-    return f"job_{uuid.uuid4().hex[:8]}"
+    return f"job_{os.urandom(4).hex()}"
 
 
 def format_timestamp(dt: datetime = None, format_type: str = "iso") -> str:
@@ -50,8 +56,7 @@ def estimate_processing_time(file_path: Union[str, Path]) -> int:
         Estimated processing time in minutes
     """
     try:
-        file_path = Path(file_path)
-        file_size_kb = file_path.stat().st_size // 1024
+        file_size_kb = os.stat(os.fspath(file_path)).st_size // 1024
 
         # Simple estimation: 1 minute per KB for demo purposes
         # Real estimation would consider sequence count, length, etc.
@@ -59,8 +64,8 @@ def estimate_processing_time(file_path: Union[str, Path]) -> int:
 
         return estimated_minutes
 
-    except Exception:
-        return 5  # Default 5 minutes if estimation fails
+    except (OSError, TypeError, ValueError):
+        return 5  # Default 5 minutes if the path is missing or unusable
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -128,21 +133,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    sanitized = filename
-
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, '_')
-
-    # Remove multiple consecutive underscores
-    while '__' in sanitized:
-        sanitized = sanitized.replace('__', '_')
-
-    # Remove leading/trailing underscores and whitespace
-    sanitized = sanitized.strip('_ ')
-
-    return sanitized
+    # Replace invalid characters, collapse underscore runs, then trim
+    sanitized = _MULTI_UNDERSCORE.sub('_', filename.translate(_SANITIZE_TABLE))
+    return sanitized.strip('_ ')
 
 
 def create_output_path(
@@ -195,18 +188,20 @@ def merge_configs(*configs) -> dict:
     """
     merged = {}
 
-    for config in configs:
-        if not isinstance(config, dict):
-            continue
-
-        for key, value in config.items():
-            if key not in merged:
-                merged[key] = value
-            elif isinstance(merged[key], dict) and isinstance(value, dict):
-                # Recursive merge for nested dictionaries
-                merged[key] = merge_configs(merged[key], value)
+    # (destination, source) pairs; popping in LIFO order finishes each nested
+    # merge before the next config is applied, so later configs still win
+    stack = [(merged, config) for config in reversed(configs) if isinstance(config, dict)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # Merge into a copy so the input dictionaries are never mutated
+                dst[key] = current = dict(current)
+                stack.append((current, value))
             else:
                 # Override with later value
-                merged[key] = value
+                dst[key] = value
 
     return merged
\ No newline at end of file
@@ -21,11 +21,35 @@ Example:
 import argparse
 import asyncio
 import json
+import logging
+import os
+import sys
 import time
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, List
+from typing import IO, Union, Optional, Dict, Any, List, Callable, Tuple
 from datetime import datetime
 
+# orjson is an optional speedup; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _json_loads = json.loads
+
+def _dumps(data: Any) -> str:
+    """Pretty-printed JSON text for console output."""
+    return _json_dumps(data).decode()
+
+# Progress output goes through logging; main() routes it to stdout
+_LOG = logging.getLogger(__name__)
+
 # ==============================================================================
 # Configuration (extracted from use case)
 # ==============================================================================
@@ -35,6 +59,9 @@ DEFAULT_CONFIG = {
     "protocol_version": "2024-11-05"
 }
 
+# Artificial server latency is off unless INTERPRO_MCP_SIMULATE=1
+_SIMULATE = os.environ.get("INTERPRO_MCP_SIMULATE") == "1"
+
 # ==============================================================================
 # Server Tool Definitions (inlined from mock implementation)
 # ==============================================================================
@@ -144,56 +171,164 @@ def get_server_tools(server_type: str) -> List[Dict[str, Any]]:
     else:
         raise ValueError(f"Unknown server type: {server_type}")
 
+async def _simulated_delay(simulate_delay: Optional[bool] = None) -> None:
+    """Sleep to mimic server latency; defaults to the INTERPRO_MCP_SIMULATE setting."""
+    if _SIMULATE if simulate_delay is None else simulate_delay:
+        await asyncio.sleep(1)
+
+def _build_server_info(server_type: str) -> Dict[str, Any]:
+    """Static connection payload for a server type."""
+    tools = get_server_tools(server_type)
+    return {
+        "server_info": {
+            "name": f"InterPro MCP Server ({server_type})",
+            "version": "1.0.0",
+            "protocol_version": DEFAULT_CONFIG["protocol_version"],
+            "type": server_type,
+            "capabilities": {
+                "tools": len(tools),
+                "async_jobs": server_type == "queue",
+                "result_parsing": True
+            }
+        },
+        "tools": tools
+    }
+
+# Prebuilt connection payloads, one per server type
+_PREBUILT = {server_type: _build_server_info(server_type) for server_type in ("basic", "queue")}
+
+def _open_for_write(file_path: Path, mode: str = 'w') -> IO:
+    """Open file_path for writing, creating missing parent directories on demand."""
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, mode)
+
 def save_discovery_results(data: Dict[str, Any], output_file: Path) -> None:
     """Save server discovery results to JSON file."""
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    with _open_for_write(output_file, 'wb') as f:
+        f.write(_json_dumps(data))
+
+# JSON schema type -> Python type checked by the argument validators
+_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "boolean": bool
+}
+
+def compile_tool_validator(tool_schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], List[str]]:
+    """Build a validator for a tool schema that returns a list of errors for given arguments."""
+    required = tuple(tool_schema.get("required", []))
+    expected_types = {
+        param: (info.get("type"), _SCHEMA_TYPES.get(info.get("type")))
+        for param, info in tool_schema.get("properties", {}).items()
+    }
+
+    def validate(arguments: Dict[str, Any]) -> List[str]:
+        # Check required parameters
+        errors = [f"Missing required parameter: {param}" for param in required if param not in arguments]
+
+        # Check parameter types (basic validation)
+        for param, value in arguments.items():
+            expected = expected_types.get(param)
+            if expected is None:
+                errors.append(f"Unknown parameter: {param}")
+                continue
+
+            type_name, python_type = expected
+            if python_type is not None and not isinstance(value, python_type):
+                errors.append(f"Parameter '{param}' should be {type_name}, got {type(value).__name__}")
+
+        return errors
+
+    return validate
+
+# Validators for the built-in tools, compiled once; keyed by name with the schema they were built from
+_VALIDATORS = {
+    tool["name"]: (tool["inputSchema"], compile_tool_validator(tool["inputSchema"]))
+    for tool in BASIC_SERVER_TOOLS + QUEUE_SERVER_TOOLS
+}
 
-def validate_tool_arguments(tool_schema: Dict[str, Any], arguments: Dict[str, Any]) -> List[str]:
+def validate_tool_arguments(
+    tool_schema: Dict[str, Any],
+    arguments: Dict[str, Any],
+    tool_name: Optional[str] = None
+) -> List[str]:
     """Validate tool arguments against schema and return list of errors."""
-    errors = []
-    properties = tool_schema.get("properties", {})
-    required = tool_schema.get("required", [])
-
-    # Check required parameters
-    for param in required:
-        if param not in arguments:
-            errors.append(f"Missing required parameter: {param}")
-
-    # Check parameter types (basic validation)
-    for param, value in arguments.items():
-        if param not in properties:
-            errors.append(f"Unknown parameter: {param}")
-            continue
-
-        expected_type = properties[param].get("type")
-        if expected_type == "string" and not isinstance(value, str):
-            errors.append(f"Parameter '{param}' should be string, got {type(value).__name__}")
-        elif expected_type == "integer" and not isinstance(value, int):
-            errors.append(f"Parameter '{param}' should be integer, got {type(value).__name__}")
-        elif expected_type == "boolean" and not isinstance(value, bool):
-            errors.append(f"Parameter '{param}' should be boolean, got {type(value).__name__}")
-
-    return errors
+    cached = _VALIDATORS.get(tool_name)
+    if cached is not None and cached[0] is tool_schema:
+        return cached[1](arguments)
+    return compile_tool_validator(tool_schema)(arguments)
 
 # ==============================================================================
 # Mock Tool Execution (inlined from patched use case)
 # ==============================================================================
+# Mock timestamps only need second granularity: [refreshed_at, timestamp, date]
+_TIMESTAMP_CACHE: List[Any] = [float("-inf"), "", ""]
+
+def _now_strings() -> Tuple[str, str]:
+    """Current (timestamp, date) strings, reformatted at most once per second."""
+    now = time.monotonic()
+    if now - _TIMESTAMP_CACHE[0] > 1.0:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _TIMESTAMP_CACHE[:] = (now, timestamp, timestamp[:10])
+    return _TIMESTAMP_CACHE[1], _TIMESTAMP_CACHE[2]
+
+# Fixed pieces of the mock interpro_run TSV; only the timestamp and input vary
+_MOCK_RUN_HEAD = "# InterProScan version 5.59-91.0 - Mock Analysis\n# Analysis completed: "
+_MOCK_RUN_COLUMNS = (
+    "\n#\n# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways"
+    "\nPROTEIN_1\thash1abc123\t256\tPfam\tPF00001\tTest_Domain\t15\t245\t1.2E-15\tT\t"
+)
+_MOCK_RUN_DOMAIN = (
+    "\tIPR001001\tTest domain\tGO:0003677|DNA binding\tREACTOME:R-HSA-12345"
+    "\nPROTEIN_1\thash1abc123\t256\tPRINTS\tPR00001\tTest_Family\t50\t200\t-\tT\t"
+)
+_MOCK_RUN_FAMILY = "\tIPR002001\tTest family\tGO:0005515|protein binding\t-"
+
+# Flat responses per tool; a shallow copy per call gets the job_id filled in
+_MOCK_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "interpro_run_async": {
+        "status": "success",
+        "job_id": "",
+        "message": "Job submitted successfully to queue",
+        "estimated_completion": "2025-12-21 15:30:00",
+        "queue_position": 3
+    },
+    "get_job_status": {
+        "status": "success",
+        "job_id": "",
+        "job_status": "completed",
+        "progress": 100,
+        "submitted_at": "2025-12-21 14:30:00",
+        "completed_at": "2025-12-21 14:45:00",
+        "execution_time": "15m 32s"
+    },
+    "get_job_result": {
+        "status": "success",
+        "job_id": "",
+        "results": "# Mock async job results\nPROTEIN_1\tresult_data_here...",
+        "output_format": "tsv",
+        "result_size": "2.3 MB"
+    },
+    "cancel_job": {
+        "status": "success",
+        "job_id": "",
+        "message": "Job cancelled successfully"
+    }
+}
+
 def generate_mock_tool_response(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Generate realistic mock responses for tool calls."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
     if tool_name == "interpro_run":
+        timestamp, date = _now_strings()
         return {
             "status": "success",
-            "output": f"""# InterProScan version 5.59-91.0 - Mock Analysis
-# Analysis completed: {timestamp}
-# Input: {arguments.get('input_file', 'unknown')}
-#
-# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways
-PROTEIN_1\thash1abc123\t256\tPfam\tPF00001\tTest_Domain\t15\t245\t1.2E-15\tT\t{timestamp[:10]}\tIPR001001\tTest domain\tGO:0003677|DNA binding\tREACTOME:R-HSA-12345
-PROTEIN_1\thash1abc123\t256\tPRINTS\tPR00001\tTest_Family\t50\t200\t-\tT\t{timestamp[:10]}\tIPR002001\tTest family\tGO:0005515|protein binding\t-""",
+            "output": (
+                f"{_MOCK_RUN_HEAD}{timestamp}\n# Input: {arguments.get('input_file', 'unknown')}"
+                f"{_MOCK_RUN_COLUMNS}{date}{_MOCK_RUN_DOMAIN}{date}{_MOCK_RUN_FAMILY}"
+            ),
             "format": arguments.get("output_format", "tsv"),
             "metadata": {
                 "analysis_time": "1.2s",
@@ -222,44 +357,6 @@ PROTEIN_1\thash1abc123\t256\tPRINTS\tPR00001\tTest_Family\t50\t200\t-\tT\t{times
             }
         }
 
-    elif tool_name == "interpro_run_async":
-        import uuid
-        job_id = f"mock_job_{uuid.uuid4().hex[:8]}"
-        return {
-            "status": "success",
-            "job_id": job_id,
-            "message": "Job submitted successfully to queue",
-            "estimated_completion": "2025-12-21 15:30:00",
-            "queue_position": 3
-        }
-
-    elif tool_name == "get_job_status":
-        return {
-            "status": "success",
-            "job_id": arguments["job_id"],
-            "job_status": "completed",
-            "progress": 100,
-            "submitted_at": "2025-12-21 14:30:00",
-            "completed_at": "2025-12-21 14:45:00",
-            "execution_time": "15m 32s"
-        }
-
-    elif tool_name == "get_job_result":
-        return {
-            "status": "success",
-            "job_id": arguments["job_id"],
-            "results": "# Mock async job results\nPROTEIN_1\tresult_data_here...",
-            "output_format": "tsv",
-            "result_size": "2.3 MB"
-        }
-
-    elif tool_name == "cancel_job":
-        return {
-            "status": "success",
-            "job_id": arguments["job_id"],
-            "message": "Job cancelled successfully"
-        }
-
     elif tool_name == "list_jobs":
         return {
             "status": "success",
@@ -282,18 +379,28 @@ PROTEIN_1\thash1abc123\t256\tPRINTS\tPR00001\tTest_Family\t50\t200\t-\tT\t{times
             "total_count": 2
         }
 
-    else:
+    prototype = _MOCK_RESPONSES.get(tool_name)
+    if prototype is None:
         return {
             "status": "error",
             "error": f"Unknown tool: {tool_name}"
         }
 
+    response = {**prototype}
+    if tool_name == "interpro_run_async":
+        import uuid
+        response["job_id"] = f"mock_job_{uuid.uuid4().hex[:8]}"
+    else:
+        response["job_id"] = arguments["job_id"]
+    return response
+
 # ==============================================================================
 # Core Functions (main logic extracted from use case)
 # ==============================================================================
 async def connect_to_server(
     server_type: str = "basic",
     config: Optional[Dict[str, Any]] = None,
+    simulate_delay: Optional[bool] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -302,6 +409,7 @@ async def connect_to_server(
     Args:
         server_type: Type of server to connect to ("basic" or "queue")
         config: Configuration dict (uses DEFAULT_CONFIG if not provided)
+        simulate_delay: Sleep to mimic connection latency (defaults to INTERPRO_MCP_SIMULATE)
         **kwargs: Override specific config parameters
 
     Returns:
@@ -316,33 +424,28 @@ async def connect_to_server(
     """
     config = {**DEFAULT_CONFIG, **(config or {}), **kwargs}
 
-    print(f"🔌 Connecting to InterPro MCP server ({server_type})")
+    _LOG.info("🔌 Connecting to InterPro MCP server (%s)", server_type)
 
     # Simulate connection delay
-    await asyncio.sleep(1)
-
-    # Get server tools
-    tools = get_server_tools(server_type)
+    await _simulated_delay(simulate_delay)
 
-    # Generate server info
+    # Server info is static per server type; only the protocol version is per call
+    prebuilt = _PREBUILT.get(server_type)
+    if prebuilt is None:
+        raise ValueError(f"Unknown server type: {server_type}")
+    tools = prebuilt["tools"]
     server_info = {
-        "name": f"InterPro MCP Server ({server_type})",
-        "version": "1.0.0",
+        **prebuilt["server_info"],
         "protocol_version": config["protocol_version"],
-        "type": server_type,
-        "capabilities": {
-            "tools": len(tools),
-            "async_jobs": server_type == "queue",
-            "result_parsing": True
-        }
+        "capabilities": {**prebuilt["server_info"]["capabilities"]}
     }
 
-    print(f"✅ Connected to MCP server")
-    print(f"📋 Server: {server_info['name']} v{server_info['version']}")
-    print(f"🛠️  Available tools: {len(tools)}")
+    _LOG.info("✅ Connected to MCP server")
+    _LOG.info("📋 Server: %s v%s", server_info['name'], server_info['version'])
+    _LOG.info("🛠️  Available tools: %s", len(tools))
 
     for tool in tools:
-        print(f"  • {tool['name']}: {tool['description']}")
+        _LOG.info("  • %s: %s", tool['name'], tool['description'])
 
     return {
         "server_info": server_info,
@@ -354,18 +457,28 @@ async def connect_to_server(
         }
     }
 
-async def analyze_tool_schemas(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """
-    Analyze tool schemas to understand input/output requirements.
-
-    Args:
-        tools: List of tool definitions
-
-    Returns:
-        Dict containing schema analysis results
-    """
-    print(f"\n🔍 Analyzing Tool Schemas")
-
+def _build_tool_index(tools: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map tool names to definitions, for one tool list."""
+    # First definition wins, as with the original linear scan
+    index = {}
+    for tool in tools:
+        index.setdefault(tool["name"], tool)
+    return index
+
+# Indexes for the built-in tool lists, built once; any other list is indexed per call
+_BUILTIN_TOOL_INDEXES = tuple(
+    (tools, _build_tool_index(tools)) for tools in (BASIC_SERVER_TOOLS, QUEUE_SERVER_TOOLS)
+)
+
+def _tool_index(tools: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map tool names to definitions, reusing the prebuilt index for a built-in list."""
+    for builtin, index in _BUILTIN_TOOL_INDEXES:
+        if tools is builtin:
+            return index
+    return _build_tool_index(tools)
+
+def _schema_analysis(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the schema analysis for one tool list."""
     analysis = {
         "total_tools": len(tools),
         "tools_with_schemas": len(tools),
@@ -377,38 +490,67 @@ async def analyze_tool_schemas(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
         schema = tool["inputSchema"]
 
         required_params = schema.get("required", [])
+        required_set = frozenset(required_params)
         all_params = schema.get("properties", {})
 
+        param_details = {}
         analysis["schema_analysis"][tool_name] = {
             "required_params": len(required_params),
             "total_params": len(all_params),
-            "param_details": {}
+            "param_details": param_details
         }
 
         # Analyze each parameter
         for param_name, param_info in all_params.items():
-            analysis["schema_analysis"][tool_name]["param_details"][param_name] = {
-                "type": param_info.get("type", "unknown"),
-                "required": param_name in required_params,
-                "description": param_info.get("description", "No description"),
-                "default": param_info.get("default", "No default")
+            param_get = param_info.get
+            param_details[param_name] = {
+                "type": param_get("type", "unknown"),
+                "required": param_name in required_set,
+                "description": param_get("description", "No description"),
+                "default": param_get("default", "No default")
             }
 
-        print(f"\n  📄 {tool_name}:")
-        print(f"    Description: {tool['description']}")
-        print(f"    Required params: {len(required_params)}")
-        print(f"    Total params: {len(all_params)}")
+    return analysis
+
+async def analyze_tool_schemas(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Analyze tool schemas to understand input/output requirements.
+
+    Args:
+        tools: List of tool definitions
+
+    Returns:
+        Dict containing schema analysis results
+    """
+    _LOG.info("\n🔍 Analyzing Tool Schemas")
+
+    analysis = _schema_analysis(tools)
+
+    # The per-tool report is only output; skip walking the schemas when it is not shown
+    if not _LOG.isEnabledFor(logging.INFO):
+        return analysis
+
+    for tool in tools:
+        tool_name = tool["name"]
+        required_params = tool["inputSchema"].get("required", [])
+        all_params = tool["inputSchema"].get("properties", {})
+
+        _LOG.info("\n  📄 %s:", tool_name)
+        _LOG.info("    Description: %s", tool['description'])
+        _LOG.info("    Required params: %s", len(required_params))
+        _LOG.info("    Total params: %s", len(all_params))
 
         for param in required_params:
             param_type = all_params.get(param, {}).get("type", "unknown")
-            print(f"    • {param} ({param_type}) - Required")
+            _LOG.info("    • %s (%s) - Required", param, param_type)
 
     return analysis
 
 async def call_tool(
     tool_name: str,
     arguments: Dict[str, Any],
-    tools: List[Dict[str, Any]]
+    tools: List[Dict[str, Any]],
+    simulate_delay: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Call a specific MCP tool with arguments.
@@ -417,46 +559,45 @@ async def call_tool(
         tool_name: Name of the tool to call
         arguments: Tool arguments
         tools: List of available tools (for validation)
+        simulate_delay: Sleep to mimic processing time (defaults to INTERPRO_MCP_SIMULATE)
 
     Returns:
         Dict containing tool execution results
     """
     # Find the tool
-    tool_def = None
-    for tool in tools:
-        if tool["name"] == tool_name:
-            tool_def = tool
-            break
+    tool_def = _tool_index(tools).get(tool_name)
 
     if not tool_def:
         raise ValueError(f"Tool '{tool_name}' not found")
 
     # Validate arguments
-    errors = validate_tool_arguments(tool_def["inputSchema"], arguments)
+    errors = validate_tool_arguments(tool_def["inputSchema"], arguments, tool_name)
     if errors:
         raise ValueError(f"Argument validation failed: {'; '.join(errors)}")
 
-    print(f"\n⚡ Calling tool: {tool_name}")
-    print(f"📝 Arguments: {json.dumps(arguments, indent=2)}")
+    _LOG.info("\n⚡ Calling tool: %s", tool_name)
+    if _LOG.isEnabledFor(logging.INFO):
+        _LOG.info("📝 Arguments: %s", _dumps(arguments))
 
     # Simulate processing time
-    await asyncio.sleep(1)
+    await _simulated_delay(simulate_delay)
 
     # Generate mock response
     response = generate_mock_tool_response(tool_name, arguments)
 
-    print(f"✅ Tool execution completed")
+    _LOG.info("✅ Tool execution completed")
     if response["status"] == "success":
-        print(f"📊 Success: Tool '{tool_name}' executed successfully")
+        _LOG.info("📊 Success: Tool '%s' executed successfully", tool_name)
     else:
-        print(f"❌ Error: {response.get('error', 'Unknown error')}")
+        _LOG.info("❌ Error: %s", response.get('error', 'Unknown error'))
 
     return response
 
 async def run_comprehensive_demo(
     server_type: str = "basic",
     input_file: Optional[Union[str, Path]] = None,
-    save_results: Optional[Union[str, Path]] = None
+    save_results: Optional[Union[str, Path]] = None,
+    simulate_delay: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Run a comprehensive demonstration of MCP server capabilities.
@@ -465,6 +606,7 @@ async def run_comprehensive_demo(
         server_type: Type of server to demonstrate
         input_file: Optional input file for tool demonstration
         save_results: Optional path to save results
+        simulate_delay: Pace each step with simulated latency (defaults to INTERPRO_MCP_SIMULATE)
 
     Returns:
         Dict containing complete demonstration results
@@ -476,11 +618,11 @@ async def run_comprehensive_demo(
     }
 
     # Step 1: Connect and discover
-    print("=" * 60)
-    print("Step 1: Server Connection and Discovery")
-    print("=" * 60)
+    _LOG.info("=" * 60)
+    _LOG.info("Step 1: Server Connection and Discovery")
+    _LOG.info("=" * 60)
 
-    connection_info = await connect_to_server(server_type)
+    connection_info = await connect_to_server(server_type, simulate_delay=simulate_delay)
     results["steps"].append({
         "step": "connection",
         "status": "success",
@@ -488,9 +630,9 @@ async def run_comprehensive_demo(
     })
 
     # Step 2: Schema analysis
-    print("\n" + "=" * 60)
-    print("Step 2: Tool Schema Analysis")
-    print("=" * 60)
+    _LOG.info("\n" + "=" * 60)
+    _LOG.info("Step 2: Tool Schema Analysis")
+    _LOG.info("=" * 60)
 
     schema_analysis = await analyze_tool_schemas(connection_info["tools"])
     results["steps"].append({
@@ -500,9 +642,9 @@ async def run_comprehensive_demo(
     })
 
     # Step 3: Tool demonstration
-    print("\n" + "=" * 60)
-    print("Step 3: Tool Demonstration")
-    print("=" * 60)
+    _LOG.info("\n" + "=" * 60)
+    _LOG.info("Step 3: Tool Demonstration")
+    _LOG.info("=" * 60)
 
     tool_results = []
 
@@ -513,7 +655,7 @@ async def run_comprehensive_demo(
         else:
             demo_args = {"input_file": "examples/data/sample.fasta"}
 
-        tool_result = await call_tool("interpro_run", demo_args, connection_info["tools"])
+        tool_result = await call_tool("interpro_run", demo_args, connection_info["tools"], simulate_delay)
         tool_results.append({"tool": "interpro_run", "result": tool_result})
 
     elif server_type == "queue":
@@ -524,13 +666,13 @@ async def run_comprehensive_demo(
             demo_args = {"input_file": "examples/data/sample.fasta", "priority": 5}
 
         # Submit job
-        submit_result = await call_tool("interpro_run_async", demo_args, connection_info["tools"])
+        submit_result = await call_tool("interpro_run_async", demo_args, connection_info["tools"], simulate_delay)
         tool_results.append({"tool": "interpro_run_async", "result": submit_result})
 
         # Check status
         if submit_result["status"] == "success":
             job_id = submit_result["job_id"]
-            status_result = await call_tool("get_job_status", {"job_id": job_id}, connection_info["tools"])
+            status_result = await call_tool("get_job_status", {"job_id": job_id}, connection_info["tools"], simulate_delay)
             tool_results.append({"tool": "get_job_status", "result": status_result})
 
     results["steps"].append({
@@ -545,7 +687,7 @@ async def run_comprehensive_demo(
     if save_results:
         save_path = Path(save_results)
         save_discovery_results(results, save_path)
-        print(f"\n💾 Results saved to: {save_path}")
+        _LOG.info("\n💾 Results saved to: %s", save_path)
 
     return results
 
@@ -576,6 +718,8 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     async def run_commands():
         if args.demo:
             # Run comprehensive demo
@@ -607,15 +751,15 @@ def main():
                 parser.error("--args required when calling tool")
 
             try:
-                arguments = json.loads(args.args)
-            except json.JSONDecodeError:
+                arguments = _json_loads(args.args)
+            except ValueError:
                 parser.error("--args must be valid JSON")
 
             connection_info = await connect_to_server(args.server_type)
             result = await call_tool(args.call_tool, arguments, connection_info["tools"])
 
             print(f"\nTool Result:")
-            print(json.dumps(result, indent=2))
+            print(_dumps(result))
 
         else:
             # Default: just connect and show tools
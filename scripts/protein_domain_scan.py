@@ -18,10 +18,41 @@ Example:
 # ==============================================================================
 import argparse
 import asyncio
+import csv
+import functools
+import io
 import json
+import logging
+import mmap
+import os
+import re
+import sys
 import time
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, List
+from typing import IO, Union, Optional, Dict, Any, Iterable, List
+
+# pandas is optional; its C CSV reader takes over for large TSV results
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# orjson is an optional speedup; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+    _json_loads = json.loads
+
+# Progress output goes through logging; main() routes it to stdout
+_LOG = logging.getLogger(__name__)
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -35,6 +66,19 @@ DEFAULT_CONFIG = {
     "databases": None  # None means all databases
 }
 
+# Artificial analysis latency is off unless INTERPRO_MCP_SIMULATE=1
+_SIMULATE = os.environ.get("INTERPRO_MCP_SIMULATE") == "1"
+
+# Results smaller than this parse faster with the line loop than with pandas
+PANDAS_MIN_TSV_SIZE = 64 << 20
+
+# Analysis types classified as domains vs families
+_DOMAIN_ANALYSES = frozenset({'Pfam', 'SMART', 'GENE3D'})
+_FAMILY_ANALYSES = frozenset({'PRINTS', 'PANTHER'})
+
+# Bytes stripped from FASTA sequence lines
+_FASTA_WHITESPACE = b' \t\r\n'
+
 # ==============================================================================
 # Inlined Utility Functions (simplified from repo)
 # ==============================================================================
@@ -43,37 +87,66 @@ def load_fasta(file_path: Path) -> List[tuple]:
     if not file_path.exists():
         raise FileNotFoundError(f"FASTA file not found: {file_path}")
 
+    data = file_path.read_bytes()
     sequences = []
-    header = None
-    sequence = ""
-
-    with open(file_path) as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('>'):
-                if header is not None:
-                    sequences.append((header, sequence))
-                header = line
-                sequence = ""
-            else:
-                sequence += line
-
-        if header is not None:
-            sequences.append((header, sequence))
+
+    # Records start at a '>' beginning a line; anything before the first is ignored
+    blocks = data.split(b'\n>')
+    if blocks[0].startswith(b'>'):
+        blocks[0] = blocks[0][1:]
+    else:
+        blocks = blocks[1:]
+
+    for block in blocks:
+        header, _, body = block.partition(b'\n')
+        sequence = body.translate(None, _FASTA_WHITESPACE)
+        sequences.append((">" + header.rstrip().decode(), sequence.decode()))
 
     return sequences
 
+# Slice of a memory-mapped FASTA file handed to bytes.count at a time
+FASTA_SCAN_CHUNK = 1 << 20
+
+def count_fasta_records(file_path: Union[str, Path]) -> int:
+    """
+    Count FASTA records (a '>' starting a line) without building them.
+
+    Matches len(load_fasta(file_path)); the file is memory-mapped and scanned in C.
+    Also used by the MCP server, so this is the one implementation of the rule.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"FASTA file not found: {file_path}")
+
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            count = mm[:1] == b'>'
+            # mmap has no count(); slices overlap by one byte so a '\n>' pair
+            # straddling a boundary is counted exactly once
+            for start in range(0, size, FASTA_SCAN_CHUNK):
+                count += mm[start:start + FASTA_SCAN_CHUNK + 1].count(b'\n>')
+            return int(count)
+
+def _open_for_write(file_path: Path, mode: str = 'w') -> IO:
+    """Open file_path for writing, creating missing parent directories on demand."""
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(file_path, mode)
+
 def save_tsv_output(data: str, file_path: Path) -> None:
     """Save TSV data to file."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w') as f:
+    with _open_for_write(file_path) as f:
         f.write(data)
 
 def save_json_output(data: Dict[str, Any], file_path: Path) -> None:
     """Save JSON data to file."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with _open_for_write(file_path, 'wb') as f:
+        f.write(_json_dumps(data))
 
 def create_sample_fasta(output_path: Path) -> None:
     """Create a sample protein FASTA file with known domains."""
@@ -92,35 +165,103 @@ def create_sample_fasta(output_path: Path) -> None:
          "LQVGQVELGGGPGAGSLQPLALEGSLQKRGIVEQCCTSICSLYQLENYCN")
     ]
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
+    with _open_for_write(output_path) as f:
         for header, sequence in sample_sequences:
             f.write(f"{header}\n{sequence}\n")
 
 # ==============================================================================
 # InterPro Analysis Functions (inlined from patched use case)
 # ==============================================================================
+# Mock InterProScan output, joined once at import
+_MOCK_TSV_ROWS = (
+    "# InterProScan version 5.59-91.0",
+    "# What is InterProScan? InterProScan is a sequence analysis application (nucleotide and protein sequences) that combines different protein signature recognition methods from the InterPro database.",
+    "# Version 5.59-91.0",
+    "# Analysis Date: 2025-12-21",
+    "",
+    "# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways",
+    "P53_HUMAN\tabc123def456\t393\tPfam\tPF00870\tP53\t1\t292\t1.2E-23\tT\t21-12-2025\tIPR011615\tP53 DNA-binding domain\tGO:0003677|DNA binding,GO:0003700|DNA-binding transcription factor activity\tREACTOME:R-HSA-69473",
+    "P53_HUMAN\tabc123def456\t393\tPRINTS\tPR00659\tP53\t10\t45\t-\tT\t21-12-2025\tIPR002117\tP53 tumor suppressor\tGO:0006915|apoptotic process,GO:0030330|DNA damage response\t-",
+    "P53_HUMAN\tabc123def456\t393\tProSiteProfiles\tPS50963\tP53_TETRAMER\t325\t355\t8.234\tT\t21-12-2025\tIPR010991\tP53 tetramerisation motif\tGO:0046982|protein heterodimerization activity\t-",
+    "INSULIN_HUMAN\tdef789ghi012\t110\tPfam\tPF00049\tInsulin\t25\t110\t2.1E-15\tT\t21-12-2025\tIPR022353\tInsulin\tGO:0005179|hormone activity,GO:0042593|glucose homeostasis\tREACTOME:R-HSA-264876",
+    "INSULIN_HUMAN\tdef789ghi012\t110\tSUPERFAMILY\tSSF57447\tInsulin-like\t30\t105\t1.5E-12\tT\t21-12-2025\tIPR022353\tInsulin\tGO:0016020|membrane\tKEGG:map04910",
+)
+_MOCK_TSV = "\n".join(_MOCK_TSV_ROWS)
+
 def generate_mock_tsv(sequence_count: int = 2) -> str:
     """Generate realistic mock TSV output for demonstration."""
-    tsv_data = [
-        "# InterProScan version 5.59-91.0",
-        "# What is InterProScan? InterProScan is a sequence analysis application (nucleotide and protein sequences) that combines different protein signature recognition methods from the InterPro database.",
-        "# Version 5.59-91.0",
-        "# Analysis Date: 2025-12-21",
-        "",
-        "# Sequence\tMD5 checksum\tSequence length\tAnalysis\tSignature accession\tSignature description\tStart location\tStop location\tScore\tStatus\tDate\tInterPro accession\tInterPro description\tGO annotations\tPathways",
-        "P53_HUMAN\tabc123def456\t393\tPfam\tPF00870\tP53\t1\t292\t1.2E-23\tT\t21-12-2025\tIPR011615\tP53 DNA-binding domain\tGO:0003677|DNA binding,GO:0003700|DNA-binding transcription factor activity\tREACTOME:R-HSA-69473",
-        "P53_HUMAN\tabc123def456\t393\tPRINTS\tPR00659\tP53\t10\t45\t-\tT\t21-12-2025\tIPR002117\tP53 tumor suppressor\tGO:0006915|apoptotic process,GO:0030330|DNA damage response\t-",
-        "P53_HUMAN\tabc123def456\t393\tProSiteProfiles\tPS50963\tP53_TETRAMER\t325\t355\t8.234\tT\t21-12-2025\tIPR010991\tP53 tetramerisation motif\tGO:0046982|protein heterodimerization activity\t-",
-        "INSULIN_HUMAN\tdef789ghi012\t110\tPfam\tPF00049\tInsulin\t25\t110\t2.1E-15\tT\t21-12-2025\tIPR022353\tInsulin\tGO:0005179|hormone activity,GO:0042593|glucose homeostasis\tREACTOME:R-HSA-264876",
-        "INSULIN_HUMAN\tdef789ghi012\t110\tSUPERFAMILY\tSSF57447\tInsulin-like\t30\t105\t1.5E-12\tT\t21-12-2025\tIPR022353\tInsulin\tGO:0016020|membrane\tKEGG:map04910"
-    ]
-    return "\n".join(tsv_data)
+    return _MOCK_TSV
+
+# Rows the line loop keeps: not a comment, not blank, and at least 15 tab-separated fields
+_TSV_DATA_ROW_RE = re.compile(r'^(?!#)(?=[^\n]*\S)(?:[^\t\n]*\t){14}[^\n]*', re.MULTILINE)
+
+def _parse_tsv_results_pandas(tsv_content: str) -> Dict[str, Any]:
+    """Vectorized parse_tsv_results using pandas.read_csv; same output structure."""
+    # read_csv reads a missing trailing field and an empty one alike, so rows are
+    # selected up front, in C, by the line loop's rules
+    rows = _TSV_DATA_ROW_RE.findall(tsv_content)
+    if not rows:
+        return parse_tsv_results(())
+
+    df = pd.read_csv(
+        io.StringIO('\n'.join(rows)),
+        sep='\t',
+        header=None,
+        names=range(15),
+        usecols=range(15),
+        dtype=str,
+        keep_default_na=False,
+        # Fields are split on tabs only, as in the line loop; quotes are plain text
+        quoting=csv.QUOTE_NONE,
+        engine='c'
+    )
+
+    domain_rows = df.loc[df[3].isin(_DOMAIN_ANALYSES), [0, 5]].drop_duplicates()
+    family_rows = df.loc[df[3].isin(_FAMILY_ANALYSES), [0, 5]].drop_duplicates()
+
+    go_rows = df.loc[df[13] != '-', [0, 13]]
+    go_rows = go_rows.assign(go=go_rows[13].str.split(',')).explode('go')
+    go_rows = go_rows[go_rows['go'].str.contains('|', regex=False)]
+    go_rows = go_rows.assign(go_id=go_rows['go'].str.split('|').str[0])[[0, 'go_id']].drop_duplicates()
+
+    sequences = {
+        seq_id: {'domains': [], 'families': [], 'go_terms': []}
+        for seq_id in df[0].drop_duplicates()
+    }
+    for key, rows, column in (('domains', domain_rows, 5), ('families', family_rows, 5),
+                              ('go_terms', go_rows, 'go_id')):
+        for seq_id, value in zip(rows[0], rows[column]):
+            sequences[seq_id][key].append(value)
+
+    return {
+        'sequences': sequences,
+        'domains': list(domain_rows[5].unique()),
+        'families': list(family_rows[5].unique()),
+        'go_terms': list(go_rows['go_id'].unique())
+    }
+
+def _file_size(rows: Iterable[str]) -> int:
+    """Size on disk of an open file being parsed, or 0 for other row iterables."""
+    try:
+        return os.fstat(rows.fileno()).st_size
+    except (AttributeError, OSError):
+        return 0
+
+def parse_tsv_results(tsv_content: Union[str, Iterable[str]]) -> Dict[str, Any]:
+    """Parse TSV results (a string, or an iterable of rows such as a file) into structured format."""
+    if isinstance(tsv_content, str):
+        if pd is not None and len(tsv_content) >= PANDAS_MIN_TSV_SIZE:
+            return _parse_tsv_results_pandas(tsv_content)
+        lines = tsv_content.strip().split('\n')
+    else:
+        # Large result files go straight to the pandas reader
+        if pd is not None and _file_size(tsv_content) >= PANDAS_MIN_TSV_SIZE:
+            return _parse_tsv_results_pandas(tsv_content.read())
+        lines = tsv_content
 
-def parse_tsv_results(tsv_content: str) -> Dict[str, Any]:
-    """Parse TSV results into structured format."""
-    lines = tsv_content.strip().split('\n')
     sequences = {}
+    # Per-sequence membership sets; the records themselves hold JSON-ready lists
+    seen = {}
     domains = set()
     families = set()
     go_terms = set()
@@ -129,7 +270,7 @@ def parse_tsv_results(tsv_content: str) -> Dict[str, Any]:
         if line.startswith('#') or not line.strip():
             continue
 
-        parts = line.split('\t')
+        parts = line.rstrip('\r\n').split('\t')
         if len(parts) < 15:
             continue
 
@@ -141,20 +282,28 @@ def parse_tsv_results(tsv_content: str) -> Dict[str, Any]:
         interpro_desc = parts[12] if len(parts) > 12 and parts[12] != '-' else None
         go_annotation = parts[13] if len(parts) > 13 and parts[13] != '-' else None
 
-        if seq_id not in sequences:
-            sequences[seq_id] = {
-                'domains': set(),
-                'families': set(),
-                'go_terms': set()
+        seq_record = sequences.get(seq_id)
+        if seq_record is None:
+            seq_record = sequences[seq_id] = {
+                'domains': [],
+                'families': [],
+                'go_terms': []
             }
+            seq_seen = seen[seq_id] = (set(), set(), set())
+        else:
+            seq_seen = seen[seq_id]
 
         # Classify based on analysis type
-        if analysis in ['Pfam', 'SMART', 'GENE3D']:
+        if analysis in _DOMAIN_ANALYSES:
             domains.add(signature_desc)
-            sequences[seq_id]['domains'].add(signature_desc)
-        elif analysis in ['PRINTS', 'PANTHER']:
+            if signature_desc not in seq_seen[0]:
+                seq_seen[0].add(signature_desc)
+                seq_record['domains'].append(signature_desc)
+        elif analysis in _FAMILY_ANALYSES:
             families.add(signature_desc)
-            sequences[seq_id]['families'].add(signature_desc)
+            if signature_desc not in seq_seen[1]:
+                seq_seen[1].add(signature_desc)
+                seq_record['families'].append(signature_desc)
 
         # Parse GO terms
         if go_annotation and go_annotation != '-':
@@ -163,13 +312,9 @@ def parse_tsv_results(tsv_content: str) -> Dict[str, Any]:
                 if '|' in go:
                     go_id = go.split('|')[0]
                     go_terms.add(go_id)
-                    sequences[seq_id]['go_terms'].add(go_id)
-
-    # Convert sets to lists for JSON serialization
-    for seq_id in sequences:
-        sequences[seq_id]['domains'] = list(sequences[seq_id]['domains'])
-        sequences[seq_id]['families'] = list(sequences[seq_id]['families'])
-        sequences[seq_id]['go_terms'] = list(sequences[seq_id]['go_terms'])
+                    if go_id not in seq_seen[2]:
+                        seq_seen[2].add(go_id)
+                        seq_record['go_terms'].append(go_id)
 
     return {
         'sequences': sequences,
@@ -180,29 +325,27 @@ def parse_tsv_results(tsv_content: str) -> Dict[str, Any]:
 
 async def run_interpro_analysis(input_file: Path, config: Dict[str, Any]) -> Dict[str, Any]:
     """Run InterProScan analysis (mock implementation for demonstration)."""
-    print(f"🔬 Starting InterProScan analysis of {input_file}")
-    print(f"📁 Output format: {config['output_format']}")
+    _LOG.info("🔬 Starting InterProScan analysis of %s", input_file)
+    _LOG.info("📁 Output format: %s", config['output_format'])
 
     if config.get('databases'):
-        print(f"🗂️ Databases: {config['databases']}")
+        _LOG.info("🗂️ Databases: %s", config['databases'])
 
-    # Load and validate input
-    sequences = load_fasta(input_file)
-    print(f"📊 Found {len(sequences)} protein sequences")
+    # Count input records; the mock run never needs the sequences themselves
+    sequence_count = count_fasta_records(input_file)
+    _LOG.info("📊 Found %s protein sequences", sequence_count)
 
     # Simulate processing time
-    print("⏳ Processing sequences...")
-    await asyncio.sleep(1)  # Simulate analysis
-
-    # Generate results
-    mock_tsv = generate_mock_tsv(len(sequences))
+    _LOG.info("⏳ Processing sequences...")
+    if _SIMULATE:
+        await asyncio.sleep(1)  # Simulate analysis
 
-    print("✅ Analysis complete")
+    _LOG.info("✅ Analysis complete")
     return {
         "status": "success",
-        "output": mock_tsv,
+        "output": generate_mock_tsv(sequence_count),
         "format": config['output_format'],
-        "sequence_count": len(sequences),
+        "sequence_count": sequence_count,
         "mock": True
     }
 
@@ -234,17 +377,18 @@ async def run_protein_domain_scan(
         >>> result = await run_protein_domain_scan("input.fasta", "output.tsv")
         >>> print(result['output_file'])
     """
-    # Setup
-    input_file = Path(input_file)
+    # Setup: build each Path (and its string form) once
+    input_path = Path(input_file)
+    input_str = str(input_path)
     config = {**DEFAULT_CONFIG, **(config or {}), **kwargs}
 
-    if not input_file.exists():
-        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_str}")
 
     start_time = time.time()
 
     # Run InterProScan analysis
-    analysis_result = await run_interpro_analysis(input_file, config)
+    analysis_result = await run_interpro_analysis(input_path, config)
 
     if analysis_result["status"] != "success":
         raise RuntimeError(f"InterProScan analysis failed: {analysis_result.get('error', 'Unknown error')}")
@@ -255,20 +399,22 @@ async def run_protein_domain_scan(
     # Save output if requested
     output_paths = {}
     if output_file:
-        output_file = Path(output_file)
+        out_path = Path(output_file)
+        json_path = out_path.with_suffix('.summary.json')
+        out_str = str(out_path)
+        json_str = str(json_path)
 
         # Save raw TSV output
-        save_tsv_output(analysis_result["output"], output_file)
-        output_paths["tsv_file"] = str(output_file)
+        save_tsv_output(analysis_result["output"], out_path)
+        output_paths["tsv_file"] = out_str
 
         # Save parsed JSON summary
-        json_file = output_file.with_suffix('.summary.json')
-        save_json_output(parsed_results, json_file)
-        output_paths["json_file"] = str(json_file)
+        save_json_output(parsed_results, json_path)
+        output_paths["json_file"] = json_str
 
-        print(f"💾 Results saved:")
-        print(f"   - TSV: {output_file}")
-        print(f"   - Summary: {json_file}")
+        _LOG.info("💾 Results saved:")
+        _LOG.info("   - TSV: %s", out_str)
+        _LOG.info("   - Summary: %s", json_str)
 
     execution_time = time.time() - start_time
 
@@ -281,19 +427,19 @@ async def run_protein_domain_scan(
         "execution_time": f"{execution_time:.2f}s"
     }
 
-    print(f"📊 Analysis Summary:")
-    print(f"   - Sequences analyzed: {stats['sequences_analyzed']}")
-    print(f"   - Domains found: {stats['domains_found']}")
-    print(f"   - Families identified: {stats['families_found']}")
-    print(f"   - GO terms: {stats['go_terms_found']}")
-    print(f"   - Execution time: {stats['execution_time']}")
+    _LOG.info("📊 Analysis Summary:")
+    _LOG.info("   - Sequences analyzed: %s", stats['sequences_analyzed'])
+    _LOG.info("   - Domains found: %s", stats['domains_found'])
+    _LOG.info("   - Families identified: %s", stats['families_found'])
+    _LOG.info("   - GO terms: %s", stats['go_terms_found'])
+    _LOG.info("   - Execution time: %s", stats['execution_time'])
 
     return {
         "result": parsed_results,
         "output_files": output_paths,
         "stats": stats,
         "metadata": {
-            "input_file": str(input_file),
+            "input_file": input_str,
             "config": config,
             "execution_time": execution_time,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
@@ -303,7 +449,9 @@ async def run_protein_domain_scan(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """CLI parser, built once per process."""
     parser = argparse.ArgumentParser(
         description=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -318,22 +466,27 @@ def main():
     parser.add_argument('--timeout', type=int, help='Analysis timeout in seconds')
     parser.add_argument('--create-sample', action='store_true',
                        help='Create sample input file')
+    return parser
+
+def main():
+    args = _build_parser().parse_args()
 
-    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     # Create sample data if requested
     if args.create_sample:
         input_path = Path(args.input)
-        print(f"📝 Creating sample protein FASTA at {input_path}")
         create_sample_fasta(input_path)
-        print(f"✅ Sample file created with 2 example protein sequences")
+        sys.stdout.write(
+            f"📝 Creating sample protein FASTA at {input_path}\n"
+            "✅ Sample file created with 2 example protein sequences\n"
+        )
         return
 
     # Load config if provided
     config = None
     if args.config:
-        with open(args.config) as f:
-            config = json.load(f)
+        config = _json_loads(Path(args.config).read_bytes())
 
     # Override config with CLI args
     config_overrides = {}
@@ -347,20 +500,16 @@ def main():
         config_overrides['timeout'] = args.timeout
 
     # Run analysis
-    async def run_analysis():
-        result = await run_protein_domain_scan(
-            input_file=args.input,
-            output_file=args.output,
-            config=config,
-            **config_overrides
-        )
-        return result
-
-    result = asyncio.run(run_analysis())
-    print(f"✅ Analysis completed successfully!")
-
+    result = asyncio.run(run_protein_domain_scan(
+        input_file=args.input,
+        output_file=args.output,
+        config=config,
+        **config_overrides
+    ))
+    lines = ["✅ Analysis completed successfully!"]
     if args.output:
-        print(f"📁 Output files: {result['output_files']}")
+        lines.append(f"📁 Output files: {result['output_files']}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return result
 
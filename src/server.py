@@ -3,16 +3,35 @@
 Provides both synchronous and asynchronous (submit) APIs for InterProScan protein analysis tools.
 """
 
+from collections import OrderedDict
 from fastmcp import FastMCP
-from pathlib import Path
-from typing import Optional, List
+from pathlib import Path, PurePath
+from typing import Any, Optional, List, Tuple
+import os
 import sys
+import threading
 
 # Setup paths
-from utils import setup_paths, validate_file_path, format_error_response, format_success_response
+from utils import (
+    setup_paths, validate_file_path, validate_file_paths, validate_fasta_header, file_sha256,
+    format_error_response, format_success_response, mcp_tool_error_handler
+)
 
 paths = setup_paths()
-SCRIPTS_DIR = paths["scripts_dir"]
+SCRIPTS_DIR = paths.scripts_dir
+
+
+def _require_script(name: str) -> str:
+    """Absolute path of a bundled script, failing at startup if it is missing."""
+    script = SCRIPTS_DIR / name
+    if not script.is_file():
+        raise FileNotFoundError(f"Required script not found: {script}")
+    return str(script)
+
+
+# Script paths passed to the job manager, verified and built once
+_SCAN_SCRIPT = _require_script("protein_domain_scan.py")
+_ASYNC_SCRIPT = _require_script("async_job_manager.py")
 
 # Import job manager
 from jobs.manager import job_manager
@@ -21,6 +40,37 @@ from loguru import logger
 # Create MCP server
 mcp = FastMCP("bio-mcp-interpro")
 
+# Identical protein analyses reuse the earlier job instead of re-running the scan:
+# (input sha256, input stem, output format, databases, output dir) -> [lock, job_id],
+# least recently used first. The stem is part of the key because it names the output file.
+SUBMIT_DEDUP_CACHE_SIZE = 128
+_submitted_jobs: "OrderedDict[Tuple[str, str, str, Optional[str], Optional[str]], List[Any]]" = OrderedDict()
+_submitted_jobs_lock = threading.Lock()  # Guards the dict only, never a submission
+
+# Job states an identical repeat request may reuse; anything else (failed, cancelled,
+# an error response, or a response without a recognisable state) is submitted again
+_REUSABLE_JOB_STATES = frozenset({"pending", "submitted", "queued", "running", "completed"})
+
+
+def _dedup_entry(dedup_key: tuple) -> List[Any]:
+    """The [lock, job_id] entry for a dedup key, created on first use."""
+    with _submitted_jobs_lock:
+        entry = _submitted_jobs.get(dedup_key)
+        if entry is None:
+            entry = _submitted_jobs[dedup_key] = [threading.Lock(), None]
+            if len(_submitted_jobs) > SUBMIT_DEDUP_CACHE_SIZE:
+                _submitted_jobs.popitem(last=False)
+        else:
+            _submitted_jobs.move_to_end(dedup_key)
+        return entry
+
+
+def _job_state(status_response: dict) -> Optional[str]:
+    """Job state from a get_job_status response, under "job_status" or else "status"."""
+    # A "status" of "success" is only the response envelope and is never reusable
+    return status_response.get("job_status", status_response.get("status"))
+
+
 # ==============================================================================
 # Job Management Tools (for async operations)
 # ==============================================================================
@@ -112,7 +162,8 @@ def get_server_info() -> dict:
 # ==============================================================================
 
 @mcp.tool()
-def analyze_protein_sequence(
+@mcp_tool_error_handler
+async def analyze_protein_sequence(
     input_file: str,
     output_format: str = "tsv",
     databases: Optional[str] = None,
@@ -133,31 +184,21 @@ def analyze_protein_sequence(
     Returns:
         Dictionary with analysis results and output file path
     """
-    try:
-        # Validate input
-        input_path = validate_file_path(input_file)
-
-        # Import the sync script function
-        from protein_domain_scan import run_protein_domain_scan
-        import asyncio
-
-        # Run the analysis
-        result = asyncio.run(run_protein_domain_scan(
-            input_file=str(input_path),
-            output_file=output_file,
-            output_format=output_format,
-            databases=databases
-        ))
-
-        return format_success_response(result, "Protein analysis completed successfully")
-
-    except FileNotFoundError as e:
-        return format_error_response(f"File not found: {e}")
-    except ValueError as e:
-        return format_error_response(f"Invalid input: {e}")
-    except Exception as e:
-        logger.error(f"analyze_protein_sequence failed: {e}")
-        return format_error_response(str(e), "analyze_protein_sequence")
+    # Validate input
+    input_path = validate_file_path(input_file)
+
+    # Import the script coroutine
+    from protein_domain_scan import run_protein_domain_scan
+
+    # Run the analysis
+    result = await run_protein_domain_scan(
+        input_file=str(input_path),
+        output_file=output_file,
+        output_format=output_format,
+        databases=databases
+    )
+
+    return format_success_response(result, "Protein analysis completed successfully")
 
 
 # ==============================================================================
@@ -165,6 +206,7 @@ def analyze_protein_sequence(
 # ==============================================================================
 
 @mcp.tool()
+@mcp_tool_error_handler
 def submit_protein_analysis(
     input_file: str,
     output_format: str = "tsv",
@@ -191,14 +233,29 @@ def submit_protein_analysis(
         - get_job_result(job_id) to get results when completed
         - get_job_log(job_id) to see execution logs
     """
-    try:
-        # Validate input
-        input_path = validate_file_path(input_file)
-
-        script_path = str(SCRIPTS_DIR / "protein_domain_scan.py")
+    # Validate input
+    input_path = validate_file_path(input_file)
+    validate_fasta_header(input_path)
+    # String form and stem are used several times below; build them once
+    input_str = os.fspath(input_path)
+    input_stem = input_path.stem
+
+    # Reuse an identical earlier submission while its job is still usable. Only identical
+    # calls share the entry's lock, so they submit once while other submissions go ahead.
+    dedup_key = (file_sha256(input_path), input_stem, output_format, databases, output_dir)
+    entry = _dedup_entry(dedup_key)
+    with entry[0]:
+        previous_job_id = entry[1]
+        if previous_job_id is not None:
+            if _job_state(job_manager.get_job_status(previous_job_id)) in _REUSABLE_JOB_STATES:
+                return format_success_response(
+                    {"job_id": previous_job_id, "deduplicated": True},
+                    "Identical analysis already submitted; returning its job"
+                )
+            entry[1] = None
 
         args = {
-            "input": str(input_path),
+            "input": input_str,
             "format": output_format
         }
 
@@ -207,23 +264,22 @@ def submit_protein_analysis(
 
         if output_dir:
             # Create specific output file in the directory
-            output_path = Path(output_dir) / f"{input_path.stem}_analysis.{output_format}"
+            output_path = PurePath(output_dir) / f"{input_stem}_analysis.{output_format}"
             args["output"] = str(output_path)
 
-        return job_manager.submit_job(
-            script_path=script_path,
+        result = job_manager.submit_job(
+            script_path=_SCAN_SCRIPT,
             args=args,
-            job_name=job_name or f"protein_analysis_{input_path.stem}"
+            job_name=job_name or f"protein_analysis_{input_stem}"
         )
 
-    except FileNotFoundError as e:
-        return format_error_response(f"File not found: {e}")
-    except Exception as e:
-        logger.error(f"submit_protein_analysis failed: {e}")
-        return format_error_response(str(e), "submit_protein_analysis")
+        entry[1] = result.get("job_id")
+
+    return result
 
 
 @mcp.tool()
+@mcp_tool_error_handler
 def submit_batch_protein_analysis(
     input_files: List[str],
     output_format: str = "tsv",
@@ -249,46 +305,37 @@ def submit_batch_protein_analysis(
     Returns:
         Dictionary with job_id for tracking the batch job
     """
-    try:
-        # Validate all input files
-        validated_files = []
-        for input_file in input_files:
-            input_path = validate_file_path(input_file)
-            validated_files.append(str(input_path))
+    # Validate all input files
+    validated_paths = validate_file_paths(input_files)
+    for input_path in validated_paths:
+        validate_fasta_header(input_path)
+    validated_files = [os.fspath(input_path) for input_path in validated_paths]
 
-        # Use the async job manager script for batch processing
-        script_path = str(SCRIPTS_DIR / "async_job_manager.py")
+    # Create a batch processing job using the async manager
+    args = {
+        "submit": "",  # Flag for submission
+        "input": validated_files[0],  # Primary input
+        "format": output_format,
+        "priority": "8"  # High priority for batch jobs
+    }
 
-        # Create a batch processing job using the async manager
-        args = {
-            "submit": "",  # Flag for submission
-            "input": validated_files[0],  # Primary input
-            "format": output_format,
-            "priority": "8"  # High priority for batch jobs
-        }
+    if databases:
+        args["databases"] = databases
 
-        if databases:
-            args["databases"] = databases
+    if output_dir:
+        args["output"] = output_dir
 
-        if output_dir:
-            args["output"] = output_dir
+    job_name = job_name or f"batch_{len(input_files)}_files"
 
-        job_name = job_name or f"batch_{len(input_files)}_files"
-
-        return job_manager.submit_job(
-            script_path=script_path,
-            args=args,
-            job_name=job_name
-        )
-
-    except FileNotFoundError as e:
-        return format_error_response(f"File not found: {e}")
-    except Exception as e:
-        logger.error(f"submit_batch_protein_analysis failed: {e}")
-        return format_error_response(str(e), "submit_batch_protein_analysis")
+    return job_manager.submit_job(
+        script_path=_ASYNC_SCRIPT,
+        args=args,
+        job_name=job_name
+    )
 
 
 @mcp.tool()
+@mcp_tool_error_handler
 def submit_large_dataset_analysis(
     input_file: str,
     priority: int = 5,
@@ -313,38 +360,31 @@ def submit_large_dataset_analysis(
         Dictionary with job_id for tracking. This uses the full async workflow
         with job queue management, progress tracking, and result persistence.
     """
-    try:
-        # Validate input
-        input_path = validate_file_path(input_file)
+    # Validate input
+    input_path = validate_file_path(input_file)
+    validate_fasta_header(input_path)
+    input_str = os.fspath(input_path)
 
-        script_path = str(SCRIPTS_DIR / "async_job_manager.py")
+    args = {
+        "submit": "",  # Submit flag
+        "input": input_str,
+        "priority": str(priority),
+        "format": "tsv"
+    }
 
-        args = {
-            "submit": "",  # Submit flag
-            "input": str(input_path),
-            "priority": str(priority),
-            "format": "tsv"
-        }
-
-        if notification_email:
-            args["email"] = notification_email
-
-        if output_dir:
-            args["output"] = output_dir
+    if notification_email:
+        args["email"] = notification_email
 
-        job_name = job_name or f"large_analysis_{input_path.stem}"
+    if output_dir:
+        args["output"] = output_dir
 
-        return job_manager.submit_job(
-            script_path=script_path,
-            args=args,
-            job_name=job_name
-        )
+    job_name = job_name or f"large_analysis_{input_path.stem}"
 
-    except FileNotFoundError as e:
-        return format_error_response(f"File not found: {e}")
-    except Exception as e:
-        logger.error(f"submit_large_dataset_analysis failed: {e}")
-        return format_error_response(str(e), "submit_large_dataset_analysis")
+    return job_manager.submit_job(
+        script_path=_ASYNC_SCRIPT,
+        args=args,
+        job_name=job_name
+    )
 
 
 # ==============================================================================
@@ -369,6 +409,9 @@ def create_sample_data(
         Dictionary with sample file information
     """
     try:
+        # Shares the record-counting rule with the scan script
+        from protein_domain_scan import count_fasta_records
+
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -382,14 +425,18 @@ def create_sample_data(
             from async_job_manager import generate_large_protein_dataset
             generate_large_protein_dataset(output_path, sequence_count)
 
+        else:
+            raise ValueError(f"Unknown sequence_type: {sequence_type}")
+
         return format_success_response({
             "output_file": str(output_path),
-            "sequence_count": sequence_count,
+            # Report what was actually written; the protein sample has a fixed size
+            "sequence_count": count_fasta_records(output_path),
             "sequence_type": sequence_type
         }, f"Sample {sequence_type} data created successfully")
 
     except Exception as e:
-        logger.error(f"create_sample_data failed: {e}")
+        logger.opt(exception=e).error("create_sample_data failed: {}", e)
         return format_error_response(str(e), "create_sample_data")
 
 
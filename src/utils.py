@@ -1,39 +1,174 @@
 """Shared utilities for bio-mcp-interpro MCP server."""
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Callable, Iterable, List, Union
+import functools
+import hashlib
+import inspect
+import mmap
+import os
+import re
+import stat
 import sys
 
+from loguru import logger
 
-def setup_paths():
-    """Setup Python paths to include scripts directory."""
+
+@dataclass(frozen=True)
+class ServerPaths:
+    """Resolved directories used by the MCP server."""
+    script_dir: Path
+    mcp_root: Path
+    scripts_dir: Path
+
+
+@functools.cache
+def setup_paths() -> ServerPaths:
+    """Setup Python paths to include scripts directory (once per process)."""
     script_dir = Path(__file__).parent.resolve()
     mcp_root = script_dir.parent
     scripts_dir = mcp_root / "scripts"
 
     # Add to path if not already there
-    if str(script_dir) not in sys.path:
-        sys.path.insert(0, str(script_dir))
-    if str(scripts_dir) not in sys.path:
-        sys.path.insert(0, str(scripts_dir))
+    on_path = set(sys.path)
+    for directory in (str(script_dir), str(scripts_dir)):
+        if directory not in on_path:
+            sys.path.insert(0, directory)
+            on_path.add(directory)
 
-    return {
-        "script_dir": script_dir,
-        "mcp_root": mcp_root,
-        "scripts_dir": scripts_dir
-    }
+    return ServerPaths(
+        script_dir=script_dir,
+        mcp_root=mcp_root,
+        scripts_dir=scripts_dir
+    )
 
 
 def validate_file_path(file_path: Union[str, Path]) -> Path:
     """Validate and convert file path."""
     path = Path(file_path)
-    if not path.exists():
+    # One stat answers both "exists" and "is a file"
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"Input file not found: {path}")
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {path}")
     return path
 
 
+# FASTA record ID: the first whitespace-delimited token after a line-leading '>'
+_FASTA_HDR_RE = re.compile(rb'^>(\S+)', re.MULTILINE)
+
+
+def extract_fasta_ids(source: Union[str, Path, bytes]) -> List[str]:
+    """
+    Return the record IDs of a FASTA file (or of its raw bytes), in order.
+
+    Files are memory-mapped and scanned by the compiled header regex in C,
+    without splitting into lines or building sequences.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return [match.group(1).decode() for match in _FASTA_HDR_RE.finditer(source)]
+
+    with open(source, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [match.group(1).decode() for match in _FASTA_HDR_RE.finditer(mm)]
+
+
+# Bytes read per step while looking for the first '>' of a FASTA file
+FASTA_PEEK_SIZE = 64
+
+
+def validate_fasta_header(file_path: Union[str, Path]) -> Path:
+    """
+    Check that a file starts like FASTA: its first non-whitespace byte is '>'.
+
+    Only the leading bytes are read, so a bad input is rejected before a
+    long-running analysis job is started on it.
+    """
+    path = Path(file_path)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while True:
+            chunk = os.read(fd, FASTA_PEEK_SIZE)
+            if not chunk:
+                raise ValueError(f"File is empty, expected FASTA: {path}")
+            chunk = chunk.lstrip()
+            if chunk:
+                break
+    finally:
+        os.close(fd)
+
+    if not chunk.startswith(b">"):
+        raise ValueError(f"File does not look like FASTA (no leading '>'): {path}")
+    return path
+
+
+# Upper bound on threads used to overlap filesystem metadata calls
+MAX_IO_WORKERS = 32
+
+
+def _map_io(func, items: List[Any]) -> List[Any]:
+    """
+    Map a blocking filesystem call over items, in order.
+
+    Calls overlap on a thread pool when there is more than one item; the
+    first exception in item order propagates, as with plain map().
+    """
+    if len(items) < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def _list_files(directory: Path) -> Dict[str, bool]:
+    """Map entry name -> is a regular file, or {} if the directory can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_file() for entry in entries}
+    except OSError:
+        return {}
+
+
+def validate_file_paths(file_paths: Iterable[Union[str, Path]]) -> List[Path]:
+    """
+    Validate and convert many file paths, in order.
+
+    Directories holding several of the paths are listed once with os.scandir
+    instead of stat-ing each file; anything the listing does not confirm as a
+    regular file is re-checked with validate_file_path for its exact error.
+    Listings and re-checks run concurrently to hide filesystem latency.
+    """
+    paths = [Path(p) for p in file_paths]
+    shared_dirs = [parent for parent, count in Counter(path.parent for path in paths).items() if count > 1]
+    listings = dict(zip(shared_dirs, _map_io(_list_files, shared_dirs)))
+
+    unconfirmed = [path for path in paths if not listings.get(path.parent, {}).get(path.name)]
+    _map_io(validate_file_path, unconfirmed)
+
+    return paths
+
+
+# Bytes read per step when hashing without hashlib.file_digest
+HASH_READ_CHUNK = 1 << 20
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """Hex SHA-256 digest of a file's contents."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashes in C without Python-level reads
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_READ_CHUNK), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
 def format_error_response(error: str, context: str = None) -> Dict[str, Any]:
     """Format a standardized error response."""
     response = {"status": "error", "error": error}
@@ -44,7 +179,46 @@ def format_error_response(error: str, context: str = None) -> Dict[str, Any]:
 
 def format_success_response(result: Dict[str, Any], message: str = None) -> Dict[str, Any]:
     """Format a standardized success response."""
-    response = {"status": "success", **result}
+    response = {"status": "success"}
+    response.update(result)
     if message:
         response["message"] = message
-    return response
\ No newline at end of file
+    return response
+
+
+def _tool_error_response(tool_name: str, error: Exception) -> Dict[str, Any]:
+    """Map an exception raised inside an MCP tool to its error response."""
+    if isinstance(error, FileNotFoundError):
+        return format_error_response(f"File not found: {error}")
+    if isinstance(error, ValueError):
+        return format_error_response(f"Invalid input: {error}")
+    logger.opt(exception=error).error("{} failed: {}", tool_name, error)
+    return format_error_response(str(error), tool_name)
+
+
+def mcp_tool_error_handler(func: Callable) -> Callable:
+    """
+    Return standardized error responses for exceptions raised by an MCP tool.
+
+    FileNotFoundError and ValueError are reported as bad input; anything else
+    is logged and reported with the tool name as context. Works for both plain
+    and async tools; apply it beneath @mcp.tool().
+    """
+    tool_name = func.__name__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return _tool_error_response(tool_name, e)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            return _tool_error_response(tool_name, e)
+    return wrapper
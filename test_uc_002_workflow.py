@@ -3,89 +3,149 @@
 Test script to demonstrate UC-002 workflow in one session
 """
 import asyncio
+import os
 import sys
+import tempfile
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent / "examples"))
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+MANAGER_SCRIPT = Path(__file__).resolve().parent / "scripts" / "async_job_manager.py"
 
-from use_case_2_async_job_submission_patched import MockInterProJobManager
+import async_job_manager as manager
 
-async def test_workflow():
-    """Test the complete async workflow"""
-    print("🧪 Testing UC-002 Async Job Workflow")
-    print("="*50)
-
-    # Initialize manager
-    manager = MockInterProJobManager()
+# Run the mock queue 100x faster: jobs start after ~0.6 s and complete after ~1.8 s
+manager.SIMULATED_TIME_SCALE = 0.01
+STATE_WAIT_TIMEOUT = 30
 
+async def _run_submit_and_complete(manager) -> bool:
+    """Submit a job and follow it through to its results (tests 1-5, sequential)"""
     # Test 1: Submit a job
     print("\n1️⃣ Submitting job...")
-    result = await manager.submit_analysis_job(
+    result = await manager.submit_job(
         input_file=Path("examples/data/large_dataset.fasta"),
         priority=8,
         databases="Pfam,PRINTS"
     )
-
-    if result["status"] == "success":
-        job_id = result["job_id"]
-        print(f"✅ Job submitted: {job_id}")
-    else:
-        print("❌ Job submission failed")
-        return
+    job_id = result["job_id"]
+    print(f"✅ Job submitted: {job_id}")
 
     # Test 2: Check status immediately
     print("\n2️⃣ Checking status immediately...")
     status = await manager.get_job_status(job_id)
-    if status["status"] == "success":
-        print(f"📊 Status: {status['job_status']} ({status['progress']}%)")
+    print(f"📊 Status: {status['job_status']} ({status['progress']}%)")
 
-    # Test 3: Wait a bit and check again
-    print("\n3️⃣ Waiting and checking status again...")
-    await asyncio.sleep(2)
-    status = await manager.get_job_status(job_id)
-    if status["status"] == "success":
+    try:
+        # Test 3: Wait for the job to start running (wakes on the state change, no fixed sleep)
+        print("\n3️⃣ Waiting for the job to start...")
+        status = await manager.wait_for_state(job_id, "running", timeout=STATE_WAIT_TIMEOUT)
         print(f"📊 Status: {status['job_status']} ({status['progress']}%)")
 
-    # Test 4: Wait for completion
-    print("\n4️⃣ Waiting for completion...")
-    await asyncio.sleep(2)
-    status = await manager.get_job_status(job_id)
-    if status["status"] == "success":
+        # Test 4: Wait for completion
+        print("\n4️⃣ Waiting for completion...")
+        status = await manager.wait_for_state(job_id, "completed", timeout=STATE_WAIT_TIMEOUT)
         print(f"📊 Status: {status['job_status']} ({status['progress']}%)")
+    except asyncio.TimeoutError:
+        print(f"❌ Job {job_id} did not reach the expected state within {STATE_WAIT_TIMEOUT}s")
+        return False
+
+    if status["job_status"] != "completed":
+        print(f"❌ Job {job_id} ended as {status['job_status']}")
+        return False
 
     # Test 5: Get results
-    if status["job_status"] == "completed":
-        print("\n5️⃣ Getting results...")
-        results = await manager.get_job_result(job_id)
-        if results["status"] == "success":
-            print(f"📁 Results retrieved successfully!")
-            print(f"First few lines of results:")
-            print(results["results"][:200] + "...")
-
-    # Test 6: List all jobs
-    print("\n6️⃣ Listing all jobs...")
-    all_jobs = await manager.list_jobs()
-    if all_jobs["status"] == "success":
-        print(f"📋 Found {len(all_jobs['jobs'])} jobs:")
-        for job in all_jobs["jobs"]:
-            print(f"  • {job['job_id']}: {job['status']}")
+    print("\n5️⃣ Getting results...")
+    results = await manager.get_job_result(job_id)
+    sys.stdout.write("\n".join([
+        "📁 Results retrieved successfully!",
+        "First few lines of results:",
+        results["results"][:200] + "..."
+    ]) + "\n")
+    return True
 
-    # Test 7: Submit another job and cancel it
+async def _run_submit_and_cancel(manager) -> bool:
+    """Submit a second job and cancel it (test 7)"""
     print("\n7️⃣ Testing job cancellation...")
-    result2 = await manager.submit_analysis_job(
+    result2 = await manager.submit_job(
         input_file=Path("examples/data/sample.fasta"),
         priority=3
     )
+    job_id2 = result2["job_id"]
+    print(f"✅ Second job submitted: {job_id2}")
+
+    # Cancel it
+    cancel_result = await manager.cancel_job(job_id2)
+    if cancel_result["status"] != "cancelled":
+        print(f"❌ Job {job_id2} was not cancelled")
+        return False
+    print(f"🚫 Job cancelled successfully")
+    return True
+
+async def _run_cancel_from_another_process(manager) -> bool:
+    """Cancel a job through the CLI in a separate process and check this one sees it (test 8)"""
+    print("\n8️⃣ Cancelling a job from another process...")
+    result3 = await manager.submit_job(
+        input_file=Path("examples/data/sample.fasta"),
+        priority=5
+    )
+    job_id3 = result3["job_id"]
+
+    # Load the job into this process's cached state, then put the submission on disk for the CLI
+    await manager.get_job_status(job_id3)
+    await manager.flush_job_state()
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(MANAGER_SCRIPT), "--cancel", job_id3,
+        stdout=asyncio.subprocess.DEVNULL
+    )
+    if await proc.wait() != 0:
+        print(f"❌ CLI could not cancel job {job_id3}")
+        return False
+
+    status = await manager.get_job_status(job_id3)
+    if status["job_status"] != "cancelled":
+        print(f"❌ Cancel from another process was lost: job {job_id3} is {status['job_status']}")
+        return False
+    print("🚫 Cancel from another process survived")
+    return True
+
+async def _run_list_jobs(manager) -> bool:
+    """List every job the other tests submitted (test 6)"""
+    print("\n6️⃣ Listing all jobs...")
+    all_jobs = await manager.list_jobs()
+    # One write for the whole listing rather than a print per job
+    sys.stdout.write("\n".join([
+        f"📋 Found {len(all_jobs['jobs'])} jobs:",
+        *(f"  • {job['job_id']}: {job['status']}" for job in all_jobs["jobs"])
+    ]) + "\n")
+    return True
+
+async def run_workflow() -> bool:
+    """Test the complete async workflow"""
+    sys.stdout.write("🧪 Testing UC-002 Async Job Workflow\n" + "=" * 50 + "\n")
+
+    # Input datasets for the jobs
+    manager.generate_large_protein_dataset(Path("examples/data/large_dataset.fasta"), 20)
+    manager.generate_large_protein_dataset(Path("examples/data/sample.fasta"), 3)
+
+    # Independent submissions run concurrently, exercising concurrent use of the manager
+    passed = await asyncio.gather(
+        _run_submit_and_complete(manager),
+        _run_submit_and_cancel(manager),
+        _run_cancel_from_another_process(manager)
+    )
 
-    if result2["status"] == "success":
-        job_id2 = result2["job_id"]
-        print(f"✅ Second job submitted: {job_id2}")
+    # Listing runs last so it sees every job
+    passed.append(await _run_list_jobs(manager))
 
-        # Cancel it
-        cancel_result = await manager.cancel_job(job_id2)
-        if cancel_result["status"] == "success":
-            print(f"🚫 Job cancelled successfully")
+    if not all(passed):
+        print("\n❌ UC-002 workflow test failed")
+        return False
 
     print("\n✅ UC-002 workflow test completed!")
+    return True
 
 if __name__ == "__main__":
-    asyncio.run(test_workflow())
\ No newline at end of file
+    # Inputs and job state (results/job_state) go to a scratch directory, not the checkout
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        ok = asyncio.run(run_workflow())
+    sys.exit(0 if ok else 1)